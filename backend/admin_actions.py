@@ -0,0 +1,218 @@
+"""Batched admin actions applied as a single multi-path update.
+
+Each operation is validated against the records it touches and turned
+into path -> value writes; every valid write in the batch then goes to
+the database in one atomic update. Approving a claim moves the item to
+archive/items rather than deleting it. Notification wording matches the
+dashboard's so users see the same messages either way.
+"""
+
+import secrets
+import time
+from datetime import datetime
+
+from archive import ARCHIVE_ROOT
+
+PUSH_CHARS = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+PICKUP_CODE_CHARS = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+
+_last_push_time = 0
+_last_rand = []
+
+
+def push_id():
+    """Chronologically ordered key in the same format as the client SDK's push()."""
+    global _last_push_time, _last_rand
+    now = int(time.time() * 1000)
+    if now == _last_push_time and _last_rand:
+        i = 11
+        while i >= 0 and _last_rand[i] == 63:
+            _last_rand[i] = 0
+            i -= 1
+        if i >= 0:
+            _last_rand[i] += 1
+    else:
+        _last_rand = [secrets.randbelow(64) for _ in range(12)]
+    _last_push_time = now
+
+    ts_chars = []
+    for _ in range(8):
+        ts_chars.append(PUSH_CHARS[now % 64])
+        now //= 64
+    return "".join(reversed(ts_chars)) + "".join(PUSH_CHARS[r] for r in _last_rand)
+
+
+def pickup_code():
+    return "".join(secrets.choice(PICKUP_CODE_CHARS) for _ in range(6))
+
+
+def notification(user_id, type_, title, message, **extra):
+    return {
+        "userId": user_id,
+        "type": type_,
+        "title": title,
+        "message": message,
+        **{k: v for k, v in extra.items() if v is not None},
+        "read": False,
+        "createdAt": datetime.now().isoformat(),
+    }
+
+
+def _notifies(owner):
+    return bool(owner) and owner != "seed_script"
+
+
+class Batch:
+    """Collects writes, letting a deletion win over writes beneath it."""
+
+    def __init__(self):
+        self.updates = {}
+
+    def set(self, path, value):
+        for existing, existing_value in list(self.updates.items()):
+            if path.startswith(existing + "/") and existing_value is None:
+                return
+            if existing.startswith(path + "/") and value is None:
+                del self.updates[existing]
+        self.updates[path] = value
+
+    def deletes(self, path):
+        return path in self.updates and self.updates[path] is None
+
+    def notify(self, *args, **kwargs):
+        self.set(f"notifications/{push_id()}", notification(*args, **kwargs))
+
+
+def _archive_item(batch, item_id, item, **fields):
+    """Move a claimed item to archive/items, so claims and notifications keep pointing at it."""
+    batch.set(f"{ARCHIVE_ROOT}/items/{item_id}", {
+        **item,
+        "status": "RESOLVED",
+        **fields,
+        "archivedAt": datetime.now().isoformat(),
+    })
+    batch.set(f"items/{item_id}", None)
+
+
+def plan(op, batch, load):
+    """Add one operation's writes to the batch. Returns extra result fields or raises ValueError."""
+    kind = op["op"]
+
+    def live(path):
+        # Records removed earlier in the same batch count as missing
+        return None if batch.deletes(path) else load(path)
+
+    if kind == "set_item_status":
+        item = live(f"items/{op['item_id']}")
+        if not item:
+            raise ValueError("Item not found")
+        status = op.get("status")
+        if status not in ("APPROVED", "REJECTED", "PENDING"):
+            raise ValueError("Invalid item status")
+        batch.set(f"items/{op['item_id']}/status", status)
+        if op.get("high_value") is not None:
+            batch.set(f"items/{op['item_id']}/highValue", bool(op["high_value"]))
+        if op.get("notify", True) and _notifies(item.get("owner")):
+            if status == "APPROVED":
+                batch.notify(item["owner"], "ITEM_APPROVED", "Item Approved",
+                             f'Your report "{item.get("title", "")}" has been approved and is now visible to other students.')
+            elif status == "REJECTED":
+                batch.notify(item["owner"], "ITEM_REJECTED", "Item Rejected",
+                             f'Your report "{item.get("title", "")}" was not approved. Please contact an administrator if you have questions.')
+        return {}
+
+    if kind == "resolve_claim":
+        claim = live(f"claims/{op['claim_id']}")
+        if not claim:
+            raise ValueError("Claim not found")
+        status = op.get("status")
+        if status not in ("APPROVED", "REJECTED"):
+            raise ValueError("Invalid claim status")
+        item_id = op.get("item_id") or claim.get("itemId")
+        batch.set(f"claims/{op['claim_id']}/status", status)
+        if status == "APPROVED":
+            item = live(f"items/{item_id}") if item_id else None
+            if not item:
+                raise ValueError("Item not found")
+            code = pickup_code()
+            batch.notify(claim.get("userId"), "CLAIM_APPROVED", "Claim Approved",
+                         f'Your claim for "{claim.get("itemTitle", "")}" has been approved. Show your pickup code to collect the item.',
+                         pickupLocation=item.get("location"), pickupCode=code)
+            _archive_item(batch, item_id, item, claimId=op["claim_id"], claimedBy=claim.get("userId"))
+            return {"pickupCode": code}
+        batch.notify(claim.get("userId"), "CLAIM_REJECTED", "Claim Not Approved",
+                     f'Your claim for "{claim.get("itemTitle", "")}" was not approved. The information provided did not match the item details.')
+        return {}
+
+    if kind == "reply_inquiry":
+        inquiry = live(f"inquiries/{op['inquiry_id']}")
+        if not inquiry:
+            raise ValueError("Inquiry not found")
+        reply = (op.get("message") or "").strip()
+        if not reply:
+            raise ValueError("Reply is empty")
+        batch.set(f"inquiries/{op['inquiry_id']}/adminReply", reply)
+        batch.set(f"inquiries/{op['inquiry_id']}/status", "RESOLVED")
+        batch.notify(inquiry.get("userId"), "INQUIRY_REPLY", "Admin Reply",
+                     f'An admin replied to your inquiry about "{inquiry.get("itemTitle", "")}": "{reply}"')
+        return {}
+
+    if kind == "claim_item":
+        # A student claiming a low-value found item directly (no claim review)
+        item = live(f"items/{op['item_id']}")
+        if not item or item.get("status") != "APPROVED" or item.get("type") != "FOUND":
+            raise ValueError("Item not found")
+        if item.get("highValue"):
+            raise ValueError("High-value items must be claimed through a claim review")
+        batch.notify(op["user_id"], "ITEM_CLAIMED", "Item Claimed",
+                     f'You claimed "{item.get("title", "")}". Pick it up at {item.get("location", "")}.')
+        _archive_item(batch, op["item_id"], item, claimedBy=op["user_id"])
+        return {"pickupLocation": item.get("location")}
+
+    if kind == "delete_item":
+        item = live(f"items/{op['item_id']}")
+        if not item:
+            raise ValueError("Item not found")
+        batch.set(f"items/{op['item_id']}", None)
+        # Archived items keep their image; a deleted one gives its upload back (see main.release_upload)
+        return {"imageUrl": item["imageUrl"]} if item.get("imageUrl") else {}
+
+    if kind == "notify":
+        if not op.get("user_id") or not op.get("message"):
+            raise ValueError("user_id and message are required")
+        batch.notify(op["user_id"], op.get("type") or "ADMIN_MESSAGE", op.get("title") or "Notification",
+                     op["message"], pickupLocation=op.get("pickupLocation"), pickupCode=op.get("pickupCode"))
+        return {}
+
+    raise ValueError(f"Unknown operation {kind}")
+
+
+def apply(operations, root_ref):
+    """Plan every operation, then write all valid ones in one update. Returns per-op results."""
+    cache = {}
+
+    def load(path):
+        if path not in cache:
+            cache[path] = root_ref.child(path).get()
+        return cache[path]
+
+    batch = Batch()
+    results = []
+    for index, op in enumerate(operations):
+        # Plan into a scratch batch so a failing operation leaves no partial writes
+        scratch = Batch()
+        scratch.updates = dict(batch.updates)
+        try:
+            extra = plan(op, scratch, load)
+        except KeyError as e:
+            results.append({"index": index, "op": op.get("op"), "ok": False, "error": f"Missing field {e}"})
+            continue
+        except ValueError as e:
+            results.append({"index": index, "op": op.get("op"), "ok": False, "error": str(e)})
+            continue
+        batch = scratch
+        results.append({"index": index, "op": op.get("op"), "ok": True, **extra})
+
+    if batch.updates:
+        root_ref.update(batch.updates)
+    return results, len(batch.updates)
@@ -17,3 +17,77 @@ VALUE_THRESHOLD = 50                 # Dollar threshold for "high value" in a hi
 CLOUDINARY_CLOUD_NAME = os.environ.get("CLOUDINARY_CLOUD_NAME", "")
 CLOUDINARY_API_KEY = os.environ.get("CLOUDINARY_API_KEY", "")
 CLOUDINARY_API_SECRET = os.environ.get("CLOUDINARY_API_SECRET", "")
+
+# Typeahead suggestions
+SUGGEST_REFRESH_SECONDS = 60        # Rebuild the prefix index from Firebase at most this often
+SUGGEST_LIMIT = 8                   # Default number of suggestions returned
+
+# Known campus locations (always offered as suggestions)
+CAMPUS_LOCATIONS = [
+    "Cafeteria", "Gym", "Aux Gym", "Media Center", "Front Office",
+    "Room E102", "Room E108", "Room E110", "Room E204",
+    "Room F101", "Room F103", "Room F105", "Room F109",
+    "Room G100", "Room G104", "Room G106", "Room G108", "Room G110",
+]
+
+# Claim pre-scoring (clear-cut claims skip CLAIM_REVIEW_MODEL)
+CLAIM_PRESCORE_ENABLED = True
+CLAIM_LOCATION_MISMATCH = 0.0       # Location score at or below this rejects the claim locally
+CLAIM_STRONG_KEYWORDS = 3           # Keywords needed in both the matching description and any text-only proof to approve locally
+
+# Local moderation pre-screen (clear-cut text skips TEXT_MODEL)
+PRESCREEN_ENABLED = True
+
+# Local value classifier (evaluate_value only calls TEXT_MODEL below this confidence)
+VALUE_CONFIDENCE_THRESHOLD = 0.85
+
+# Archival (moves old records out of the live tree into archive/<collection>)
+ARCHIVE_POLICIES = {
+    "items": {"statuses": ["REJECTED"], "days": 30},
+    "claims": {"statuses": ["APPROVED", "REJECTED", "AI_APPROVED", "AI_REJECTED"], "days": 60},
+    "inquiries": {"statuses": ["RESOLVED"], "days": 60},
+}
+ARCHIVE_BATCH_SIZE = 100            # Records per atomic multi-path update
+
+# Admin exports
+EXPORT_PAGE_SIZE = 200              # Records fetched from Firebase per page while streaming
+
+# Near-duplicate detection
+DEDUP_TEXT_THRESHOLD = 0.6          # Word overlap (shared / smaller set) to call text a duplicate
+DEDUP_MIN_SHARED_WORDS = 4          # ...and at least this many shared words
+DEDUP_IMAGE_DISTANCE = 6            # Max differing bits between image dHashes
+
+# Upload deduplication (SHA-256 of image bytes -> existing Cloudinary asset)
+UPLOAD_INDEX_PATH = os.environ.get("UPLOAD_INDEX_PATH", "upload_index.json")
+
+# Request tracing (Server-Timing header) and slow-request profiling
+SLOW_REQUEST_MS = 2000              # Requests slower than this keep their profile snapshot
+PROFILE_SLOW_REQUESTS = os.environ.get("PROFILE_SLOW_REQUESTS", "") == "1"   # Opt-in sampling profiler
+PROFILE_SAMPLE_RATE = 0.1           # Fraction of requests profiled while enabled
+PROFILE_INTERVAL_MS = 5             # Stack sampling interval
+PROFILE_RING_SIZE = 50              # Slow-request snapshots kept in memory
+
+# Batched admin actions
+ADMIN_ACTIONS_MAX = 200             # Max operations per /api/admin/actions request
+
+# Live item mirror and recency feed
+ITEM_LISTENER_ENABLED = True        # Mirror `items` in memory from Firebase change events
+ITEM_LISTENER_RETRY_SECONDS = 60    # Wait before restarting a listener that failed to start
+ITEM_STORE_REFRESH_SECONDS = 30     # Without a listener, re-fetch `items` at most this often
+FEED_DEFAULT_LIMIT = 12
+FEED_MAX_LIMIT = 50
+
+# Campuses. Each campus gets its own data root and in-memory indexes; requests pick a
+# campus with the X-Campus-Id header or their subdomain. "root": "" keeps a campus at
+# the top of the database (the original single-school layout).
+FIREBASE_DB_URL = os.environ.get("FIREBASE_DB_URL", "https://fblalf-default-rtdb.firebaseio.com/")
+CAMPUSES = {
+    "mrhs": {"name": "Marvin Ridge High School", "root": "", "subdomains": ["marvinridge"]},
+}
+DEFAULT_CAMPUS = "mrhs"
+AI_CONCURRENCY_PER_CAMPUS = 4       # Concurrent OpenAI calls allowed per campus
+AI_QUOTA_WAIT_SECONDS = 10          # How long a request waits for a free AI slot before falling back
+
+# AI search prompt packing
+SEARCH_CONTEXT_TOKENS = 600         # Token budget for the item list in the search prompt
+SEARCH_MAX_CANDIDATES = 60          # Upper bound on items sent to the model
@@ -0,0 +1,78 @@
+"""Hot/cold tiering for the Realtime Database.
+
+Records that match the archive policy are moved from their live
+collection (items, claims, inquiries) to archive/<collection>/<id> with
+a single multi-path update per batch, so a record is never in both
+places or neither. Claimed items are moved here with status RESOLVED as
+soon as their claim is approved (see admin_actions.resolve_claim).
+"""
+
+import time
+from datetime import datetime
+
+from catalog import item_timestamp
+
+ARCHIVE_ROOT = "archive"
+
+
+def select_expired(records, statuses, max_age_days, now=None):
+    """IDs of records whose status is in the policy and that are older than max_age_days."""
+    now = now or time.time()
+    cutoff = now - max_age_days * 86400
+    expired = []
+    for record_id, record in (records or {}).items():
+        if not isinstance(record, dict) or record.get("status") not in statuses:
+            continue
+        ts = item_timestamp(record)
+        if ts and ts <= cutoff:
+            expired.append(record_id)
+    return expired
+
+
+def archive_collection(root_ref, collection, policy, batch_size=100, dry_run=False, now=None):
+    """Move expired records of one collection into the archive. Returns the moved IDs."""
+    records = root_ref.child(collection).get() or {}
+    expired = select_expired(records, policy["statuses"], policy["days"], now)
+    if dry_run or not expired:
+        return expired
+
+    archived_at = datetime.now().isoformat()
+    for start in range(0, len(expired), batch_size):
+        updates = {}
+        for record_id in expired[start:start + batch_size]:
+            updates[f"{ARCHIVE_ROOT}/{collection}/{record_id}"] = {**records[record_id], "archivedAt": archived_at}
+            updates[f"{collection}/{record_id}"] = None
+        root_ref.update(updates)
+    return expired
+
+
+def run_archive(root_ref, policies, batch_size=100, dry_run=False):
+    """Apply every collection's policy. Returns {collection: [moved ids]}."""
+    now = time.time()
+    return {
+        collection: archive_collection(root_ref, collection, policy, batch_size, dry_run, now)
+        for collection, policy in policies.items()
+    }
+
+
+def query_archive(root_ref, collection, limit=50, start_after=None, status=None):
+    """Page through an archived collection in key order.
+
+    Paging is by key so no database index is needed; the status filter is
+    applied to each fetched page, so a filtered page can hold fewer than
+    `limit` records. Use the returned `next` key to continue.
+    """
+    query = root_ref.child(f"{ARCHIVE_ROOT}/{collection}").order_by_key()
+    if start_after:
+        # start_at is inclusive, so fetch one extra to make up for the cursor row
+        query = query.start_at(start_after)
+    page = query.limit_to_first(limit + (2 if start_after else 1)).get() or {}
+
+    keys = [k for k in page if k != start_after]
+    has_more = len(keys) > limit
+    keys = keys[:limit]
+    records = [
+        {"id": k, **page[k]} for k in keys
+        if status is None or page[k].get("status") == status
+    ]
+    return {"records": records, "next": keys[-1] if has_more else None}
@@ -0,0 +1,167 @@
+"""Campus location gazetteer.
+
+Turns free-text locations ("lunch room", "Room G100", "G wing") into a
+canonical place and scores how close two locations are, so claim review
+can settle obvious matches and mismatches without asking a model.
+"""
+
+import re
+from collections import namedtuple
+
+# ambiguous: several places were mentioned, or only a generic word matched
+Location = namedtuple("Location", ["place", "wing", "room", "floor", "ambiguous"])
+
+# Canonical places and the phrases students actually type for them
+PLACES = {
+    "cafeteria": ["cafeteria", "caf", "cafe", "lunch room", "lunchroom", "lunch", "commons", "dining hall"],
+    "gym": ["gym", "main gym", "gymnasium", "bleachers", "basketball court"],
+    "aux_gym": ["aux gym", "auxiliary gym", "aux", "small gym", "wrestling room"],
+    "locker_room": ["locker room", "locker rooms", "boys locker room", "girls locker room"],
+    "media_center": ["media center", "media centre", "library"],
+    "front_office": ["front office", "main office", "office", "reception", "attendance office"],
+    "auditorium": ["auditorium", "theater", "theatre"],
+    "stadium": ["stadium", "football field", "field", "track"],
+    "parking_lot": ["parking lot", "student parking", "parking deck"],
+    "bus_lot": ["bus lot", "bus loop", "bus stop"],
+}
+
+# Aliases that are often used for something else ("after lunch", "field trip", "aux cord")
+GENERIC_ALIASES = {"lunch", "field", "office", "aux", "caf", "cafe", "track", "commons"}
+
+# Classroom wings; rooms are named <wing><floor><nn>, e.g. G100, E204
+WINGS = "efg"
+
+# Walkable connections between places (weight ~ minutes apart)
+ADJACENCY = [
+    ("front_office", "cafeteria", 1),
+    ("front_office", "auditorium", 1),
+    ("front_office", "parking_lot", 1),
+    ("parking_lot", "bus_lot", 1),
+    ("cafeteria", "e_wing", 1),
+    ("e_wing", "f_wing", 1),
+    ("f_wing", "g_wing", 1),
+    ("g_wing", "media_center", 1),
+    ("cafeteria", "gym", 2),
+    ("gym", "aux_gym", 1),
+    ("gym", "locker_room", 1),
+    ("aux_gym", "locker_room", 1),
+    ("gym", "stadium", 2),
+]
+
+SAME_WING_SCORE = 0.8         # "G wing" vs "Room G100"
+SAME_FLOOR_SCORE = 0.6        # "Room G100" vs "Room G104"
+SAME_WING_OTHER_FLOOR = 0.5   # "Room E102" vs "Room E204"
+ADJACENT_SCORE = 0.4          # neighbouring areas; halves with each extra hop
+MAX_NEAR_DISTANCE = 2         # anything further apart scores 0
+
+
+def _wing_key(letter):
+    return f"{letter}_wing"
+
+
+def _all_places():
+    return list(PLACES) + [_wing_key(w) for w in WINGS]
+
+
+def _shortest_paths():
+    places = _all_places()
+    inf = float("inf")
+    dist = {a: {b: (0 if a == b else inf) for b in places} for a in places}
+    for a, b, w in ADJACENCY:
+        dist[a][b] = dist[b][a] = min(dist[a][b], w)
+    for k in places:
+        for i in places:
+            for j in places:
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+    return dist
+
+
+DISTANCES = _shortest_paths()
+
+_ROOM_RE = re.compile(rf"\b(?:room|rm)?\s*([{WINGS}])\s*-?\s*(\d)(\d\d)\b")
+_WING_RE = re.compile(rf"\b([{WINGS}])[\s-]*(?:wing|hall|hallway|building)\b|\b(?:wing|hall)\s+([{WINGS}])\b")
+_ALIASES = sorted(
+    ((alias, place) for place, aliases in PLACES.items() for alias in aliases),
+    key=lambda pair: -len(pair[0]),
+)
+_ALIAS_RES = [(re.compile(rf"\b{re.escape(alias)}\b"), place) for alias, place in _ALIASES]
+
+
+def _mentioned_places(text):
+    """Places named in the text as {place: matched only by generic aliases}, longest alias first."""
+    found = {}
+    for pattern, place in _ALIAS_RES:
+        match = pattern.search(text)
+        if not match:
+            continue
+        # Blank the match so "aux gym" is not counted again as "gym"
+        text = text[:match.start()] + " " * (match.end() - match.start()) + text[match.end():]
+        generic = match.group(0) in GENERIC_ALIASES
+        found[place] = found.get(place, True) and generic
+    return found
+
+
+def parse_location(text):
+    """Parse free text into a Location, or None if nothing on campus is recognized."""
+    text = (text or "").lower().strip()
+    if not text:
+        return None
+
+    places = _mentioned_places(text)
+
+    room = _ROOM_RE.search(text)
+    if room:
+        wing, floor, rest = room.groups()
+        return Location(_wing_key(wing), wing, f"{wing}{floor}{rest}".upper(), int(floor), bool(places))
+
+    wing = _WING_RE.search(text)
+    if wing:
+        letter = wing.group(1) or wing.group(2)
+        return Location(_wing_key(letter), letter, None, None, bool(places))
+
+    if not places:
+        return None
+    # Prefer a specific mention over a generic one ("after lunch in the gym" -> gym)
+    place = min(places, key=lambda p: places[p])
+    ambiguous = len(places) > 1 or places[place]
+    return Location(place, None, None, None, ambiguous)
+
+
+def location_match(actual, claimed):
+    """Score how well a claimed location matches the actual one.
+
+    Returns (score, reason, certain); score is 0..1, or None when either
+    side could not be parsed and the comparison is left to a human or
+    model. certain is False when either side named several places or only
+    a generic word, so the score is a hint rather than grounds to decide.
+    """
+    a = parse_location(actual)
+    b = parse_location(claimed)
+    if a is None or b is None:
+        return None, "location not recognized", False
+    score, reason = _score(a, b)
+    if a.ambiguous or b.ambiguous:
+        return score, f"{reason}, location wording ambiguous", False
+    return score, reason, True
+
+
+def _score(a, b):
+
+    if a.room and b.room:
+        if a.room == b.room:
+            return 1.0, "same room"
+        if a.wing == b.wing:
+            if a.floor == b.floor:
+                return SAME_FLOOR_SCORE, "same wing and floor, different room"
+            return SAME_WING_OTHER_FLOOR, "same wing, different floor"
+
+    if a.place == b.place:
+        if a.wing and (a.room or b.room):
+            return SAME_WING_SCORE, "same wing"
+        return 1.0, "same place"
+
+    distance = DISTANCES[a.place][b.place]
+    if distance <= MAX_NEAR_DISTANCE:
+        return ADJACENT_SCORE / distance, "nearby area"
+    return 0.0, "different area of campus"
@@ -0,0 +1,95 @@
+"""Shared helpers for item records and an in-memory mirror of the items tree."""
+
+import copy
+import threading
+from datetime import datetime
+
+
+def item_timestamp(item):
+    """Best-effort epoch seconds for an item, from createdAt or its date field."""
+    for field in ("createdAt", "date"):
+        value = item.get(field)
+        if not value or not isinstance(value, str):
+            continue
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            continue
+    return 0.0
+
+
+class ItemStore:
+    """In-memory mirror of the `items` tree, kept current from listener events.
+
+    Subscribers are called as fn(item_id, old, new) for every changed item,
+    with None standing for a missing item on either side.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.ready = False
+        self._subscribers = []
+        self._lock = threading.RLock()
+
+    def subscribe(self, fn):
+        self._subscribers.append(fn)
+
+    def get(self, item_id):
+        return self.items.get(item_id)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.items)
+
+    def load(self, items_data):
+        """Replace the whole mirror (initial sync or a put at the root)."""
+        with self._lock:
+            self._set([], items_data)
+            self.ready = True
+
+    def apply_event(self, event):
+        """Listener callback for db.reference('items').listen()."""
+        parts = [p for p in (event.path or "").split("/") if p]
+        with self._lock:
+            if event.event_type == "put":
+                self._set(parts, event.data)
+            elif event.event_type == "patch":
+                for key, value in (event.data or {}).items():
+                    self._set(parts + [p for p in key.split("/") if p], value)
+            if not parts and event.event_type == "put":
+                self.ready = True
+
+    def _set(self, parts, value):
+        if not parts:
+            new_items = value if isinstance(value, dict) else {}
+            for item_id in set(self.items) | set(new_items):
+                self._replace(item_id, new_items.get(item_id))
+            return
+
+        item_id, rest = parts[0], parts[1:]
+        if not rest:
+            self._replace(item_id, value)
+            return
+
+        item = copy.deepcopy(self.items.get(item_id)) or {}
+        node = item
+        for key in rest[:-1]:
+            node = node.setdefault(key, {})
+        if value is None:
+            node.pop(rest[-1], None)
+        else:
+            node[rest[-1]] = value
+        self._replace(item_id, item or None)
+
+    def _replace(self, item_id, new):
+        old = self.items.get(item_id)
+        if new is None:
+            self.items.pop(item_id, None)
+        else:
+            self.items[item_id] = new
+        if old != new:
+            for fn in self._subscribers:
+                try:
+                    fn(item_id, old, new)
+                except Exception as e:
+                    print(f"Item subscriber error: {e}")
@@ -3,6 +3,9 @@ import firebase_admin
 from firebase_admin import credentials, db, auth
 import sys
 
+from ai_config import CAMPUSES, DEFAULT_CAMPUS
+from tenancy import data_root, join_path
+
 # Initialize Firebase Admin
 cred = credentials.Certificate("../fblalf-firebase-adminsdk-fbsvc-ce8e5771c0.json")
 try:
@@ -12,8 +15,8 @@ except ValueError:
         'databaseURL': 'https://fblalf-default-rtdb.firebaseio.com/' 
     })
 
-def create_admin_user(username, password):
-    #Creates a admin user in Firebase Auth 
+def create_admin_user(username, password, campus_id=DEFAULT_CAMPUS):
+    #Creates a admin user in Firebase Auth, with the ADMIN role on one campus
     email = f"{username}@lf.app"
     
     try:
@@ -31,14 +34,14 @@ def create_admin_user(username, password):
             print(f"User '{username}' already exists (UID: {user.uid}). Updating role...")
 
 
-        # 2. Set Role in Realtime DB
-        ref = db.reference(f'users/{user.uid}')
+        # 2. Set Role in Realtime DB, under the campus's data root
+        ref = db.reference(join_path(data_root(campus_id, CAMPUSES[campus_id]), f'users/{user.uid}'))
         ref.update({
             'username': username,
             'role': 'ADMIN',
             'createdAt': 'SERVER_TIMESTAMP'
         })
-        print(f"Successfully set '{username}' as ADMIN.")
+        print(f"Successfully set '{username}' as ADMIN on campus '{campus_id}'.")
         
     except Exception as e:
         error_msg = str(e)
@@ -54,6 +57,8 @@ def create_admin_user(username, password):
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: python create_admin.py <username> <password>")
+        print(f"Usage: python create_admin.py <username> <password> [campus, default {DEFAULT_CAMPUS}]")
+    elif len(sys.argv) > 3 and sys.argv[3] not in CAMPUSES:
+        print(f"Unknown campus '{sys.argv[3]}'. Known campuses: {', '.join(CAMPUSES)}")
     else:
-        create_admin_user(sys.argv[1], sys.argv[2])
+        create_admin_user(sys.argv[1], sys.argv[2], *sys.argv[3:4])
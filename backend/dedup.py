@@ -0,0 +1,198 @@
+"""Near-duplicate listing detection.
+
+Text is reduced to a MinHash signature over its distinctive words and
+images to a 64-bit difference hash (dHash). Both are split into bands
+for locality-sensitive hashing, so a new submission is only compared
+against listings that share at least one band bucket rather than the
+whole catalog. Text candidates are then verified on word overlap, which
+copes better than Jaccard with a short report of a long listing.
+"""
+
+import hashlib
+import io
+import random
+import re
+import threading
+from collections import defaultdict
+
+try:
+    from PIL import Image
+except ImportError:  # image hashing is skipped without Pillow
+    Image = None
+
+NUM_PERM = 64
+TEXT_BANDS = 32                 # 32 bands x 2 rows: wide net, ~18% Jaccard tipping point
+IMAGE_BANDS = 8                 # 8 bands x 8 bits: any pair within 7 bits shares a band
+_ROWS = NUM_PERM // TEXT_BANDS
+_PRIME = (1 << 61) - 1
+
+_rng = random.Random(1729)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "the", "a", "an", "and", "or", "with", "in", "on", "of", "for", "to", "at", "found", "lost",
+    "my", "is", "it", "was", "near", "by", "from", "has", "have", "this", "that", "some", "one",
+}
+
+
+def tokens(text):
+    return {w for w in _WORD_RE.findall((text or "").lower()) if w not in STOPWORDS}
+
+
+def minhash(words):
+    """MinHash signature of a token set (tuple of NUM_PERM ints)."""
+    if not words:
+        return None
+    hashed = [int.from_bytes(hashlib.blake2b(w.encode(), digest_size=8).digest(), "big") for w in words]
+    return tuple(min((a * h + b) % _PRIME for h in hashed) for a, b in _PERMS)
+
+
+def overlap(words_a, words_b):
+    """Overlap coefficient: shared words over the smaller set."""
+    if not words_a or not words_b:
+        return 0.0, 0
+    shared = len(words_a & words_b)
+    return shared / min(len(words_a), len(words_b)), shared
+
+
+def dhash(image_bytes, size=8):
+    """64-bit difference hash of an image, or None if it cannot be decoded."""
+    if Image is None or not image_bytes:
+        return None
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            pixels = list(img.convert("L").resize((size + 1, size)).getdata())
+    except Exception:
+        return None
+    value = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def _text_bands(sig):
+    return [(i, sig[i * _ROWS:(i + 1) * _ROWS]) for i in range(TEXT_BANDS)]
+
+
+def _image_bands(value):
+    width = 64 // IMAGE_BANDS
+    mask = (1 << width) - 1
+    return [(i, (value >> (i * width)) & mask) for i in range(IMAGE_BANDS)]
+
+
+class DuplicateIndex:
+    """LSH buckets over listing text signatures and image hashes.
+
+    Kept current as an ItemStore subscriber. An item's image hash comes from
+    its imageHash field, else from image_hashes (upload URL -> dHash).
+    """
+
+    def __init__(self, image_hashes=None, statuses=("APPROVED", "PENDING")):
+        self.entries = {}
+        self.image_hashes = image_hashes if image_hashes is not None else {}
+        self.statuses = statuses
+        self._text_buckets = defaultdict(set)
+        self._image_buckets = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def from_items(cls, items_data, image_hashes=None, statuses=("APPROVED", "PENDING")):
+        index = cls(image_hashes, statuses)
+        for item_id, item in (items_data or {}).items():
+            index.on_item_changed(item_id, None, item)
+        return index
+
+    def image_hash_of(self, item):
+        image_hash = item.get("imageHash")
+        try:
+            return int(image_hash, 16) if image_hash else self.image_hashes.get(item.get("imageUrl"))
+        except (TypeError, ValueError):
+            return None
+
+    def on_item_changed(self, item_id, old, new):
+        """ItemStore subscriber: re-index an item whenever it changes."""
+        if isinstance(new, dict) and new.get("status") in self.statuses:
+            self.add(item_id, new, self.image_hash_of(new))
+        else:
+            self.remove(item_id)
+
+    def add(self, item_id, item, image_hash=None):
+        words = tokens(f"{item.get('title', '')} {item.get('description', '')}")
+        sig = minhash(words)
+        with self._lock:
+            self._add(item_id, item, words, sig, image_hash)
+
+    def _add(self, item_id, item, words, sig, image_hash):
+        self._remove(item_id)
+        self.entries[item_id] = {
+            "title": item.get("title", ""),
+            "type": item.get("type", ""),
+            "words": words,
+            "sig": sig,
+            "image": image_hash,
+        }
+        if sig:
+            for band in _text_bands(sig):
+                self._text_buckets[band].add(item_id)
+        if image_hash is not None:
+            for band in _image_bands(image_hash):
+                self._image_buckets[band].add(item_id)
+
+    def remove(self, item_id):
+        with self._lock:
+            self._remove(item_id)
+
+    def _remove(self, item_id):
+        entry = self.entries.pop(item_id, None)
+        if not entry:
+            return
+        if entry["sig"]:
+            for band in _text_bands(entry["sig"]):
+                self._text_buckets[band].discard(item_id)
+        if entry["image"] is not None:
+            for band in _image_bands(entry["image"]):
+                self._image_buckets[band].discard(item_id)
+
+    def find(self, title, description, item_type=None, image_hash=None,
+             text_threshold=0.6, min_shared=4, image_distance=6, exclude=None):
+        """Likely duplicates of a submission, best first."""
+        words = tokens(f"{title} {description}")
+        sig = minhash(words)
+        candidates = set()
+        with self._lock:
+            if sig:
+                for band in _text_bands(sig):
+                    candidates |= self._text_buckets.get(band, set())
+            if image_hash is not None:
+                for band in _image_bands(image_hash):
+                    candidates |= self._image_buckets.get(band, set())
+            candidates.discard(exclude)
+            entries = [(item_id, self.entries[item_id]) for item_id in candidates]
+
+        matches = []
+        for item_id, entry in entries:
+            if item_type and entry["type"] and entry["type"] != item_type:
+                continue
+            text_sim, shared = overlap(words, entry["words"])
+            image_dist = hamming(image_hash, entry["image"]) if image_hash is not None and entry["image"] is not None else None
+            text_match = text_sim >= text_threshold and shared >= min_shared
+            if text_match or (image_dist is not None and image_dist <= image_distance):
+                matches.append({
+                    "id": item_id,
+                    "title": entry["title"],
+                    "textSimilarity": round(text_sim, 3),
+                    "imageDistance": image_dist,
+                })
+        matches.sort(key=lambda m: (-m["textSimilarity"], m["imageDistance"] if m["imageDistance"] is not None else 64))
+        return matches
@@ -0,0 +1,151 @@
+"""Streaming NDJSON/CSV export of database collections.
+
+Records are read in key-ordered pages and written out one line at a
+time, so memory use depends on the page size, not the collection size.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, time as dtime
+
+from catalog import item_timestamp
+
+# CSV columns per collection; nested fields use dotted names
+EXPORT_COLUMNS = {
+    "items": [
+        "id", "title", "description", "category", "type", "location", "status",
+        "highValue", "date", "createdAt", "owner", "imageUrl",
+    ],
+    "claims": [
+        "id", "itemId", "itemTitle", "userId", "username", "claimedLocation", "claimedDescription",
+        "additionalProof", "status", "createdAt", "aiReview.approved", "aiReview.confidence",
+        "aiReview.reason", "aiReview.reviewedBy", "aiReview.reviewedAt",
+    ],
+    "inquiries": [
+        "id", "itemId", "itemTitle", "userId", "username", "message", "adminReply", "status", "createdAt",
+    ],
+    "valueOverrides": ["id", "title", "description", "category", "highValue"],
+}
+
+
+def iter_page_batches(ref, page_size=200):
+    """Yield lists of (key, record) pairs from ref in key order, one page per request."""
+    last_key = None
+    while True:
+        query = ref.order_by_key()
+        if last_key is not None:
+            query = query.start_at(last_key)
+        page = query.limit_to_first(page_size + (1 if last_key is not None else 0)).get() or {}
+
+        batch = []
+        for key, record in page.items():
+            if key == last_key:
+                continue
+            last_key = key
+            batch.append((key, record))
+        if batch:
+            yield batch
+        if len(batch) < page_size:
+            return
+
+
+# Collections whose records point at an item through itemId
+ITEM_LINKED = {"claims", "inquiries"}
+
+
+class LinkedHighValue:
+    """highValue lookup for claims/inquiries, via the item each record points at.
+
+    lookup(item_ids) returns {item_id: highValue} for the ids it can find.
+    It is called once per export page with that page's distinct itemIds, so
+    only one page's worth of flags is held at a time.
+    """
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+        self.flags = {}
+
+    def load(self, batch):
+        item_ids = {r.get("itemId") for _, r in batch if isinstance(r, dict) and r.get("itemId")}
+        self.flags = self.lookup(item_ids) if item_ids else {}
+
+    def __call__(self, record):
+        return self.flags.get(record.get("itemId"))
+
+
+def make_filter(status=None, date_from=None, date_to=None, high_value=None, high_value_of=None):
+    """Build a predicate over records; date bounds are inclusive calendar days.
+
+    high_value_of(record) gives the flag the high_value filter compares
+    against (the record's own highValue by default). Records where it is
+    unknown are left out whenever that filter is set.
+    """
+    high_value_of = high_value_of or (lambda record: record.get("highValue"))
+    start = datetime.combine(date_from, dtime.min).timestamp() if date_from else None
+    end = datetime.combine(date_to, dtime.max).timestamp() if date_to else None
+
+    def keep(record):
+        if not isinstance(record, dict):
+            return False
+        if status and record.get("status") != status:
+            return False
+        if high_value is not None:
+            flag = high_value_of(record)
+            if flag is None or bool(flag) != high_value:
+                return False
+        if start is not None or end is not None:
+            ts = item_timestamp(record)
+            if start is not None and ts < start:
+                return False
+            if end is not None and ts > end:
+                return False
+        return True
+
+    return keep
+
+
+def _flatten(record, column):
+    value = record
+    for part in column.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return "" if value is None else value
+
+
+def stream_ndjson(records):
+    for key, record in records:
+        yield json.dumps({"id": key, **record}) + "\n"
+
+
+def stream_csv(records, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for key, record in records:
+        row = {"id": key, **record}
+        writer.writerow([_flatten(row, c) for c in columns])
+        if buffer.tell() > 8192:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_stream(ref, collection, fmt="ndjson", keep=None, page_size=200, on_page=None):
+    """Generator of text chunks for a collection export.
+
+    on_page(batch) runs before each page is filtered, e.g. LinkedHighValue.load.
+    """
+    def records():
+        for batch in iter_page_batches(ref, page_size):
+            if on_page:
+                on_page(batch)
+            for key, record in batch:
+                if keep is None or keep(record):
+                    yield key, record
+
+    if fmt == "csv":
+        return stream_csv(records(), EXPORT_COLUMNS[collection])
+    return stream_ndjson(records())
@@ -0,0 +1,78 @@
+"""Recency-ordered feed of approved items.
+
+Kept up to date from item change events instead of sorting the whole
+catalog per request. Each bucket (everything, per category, per type)
+is an ascending array of (timestamp, id), so the newest N is a slice
+off the end.
+"""
+
+import bisect
+import threading
+
+from catalog import item_timestamp
+
+
+class RecencyFeed:
+    def __init__(self):
+        self._buckets = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _keys(item):
+        keys = [("all", "")]
+        if item.get("category"):
+            keys.append(("category", item["category"]))
+        if item.get("type"):
+            keys.append(("type", item["type"]))
+        return keys
+
+    def on_item_changed(self, item_id, old, new):
+        """ItemStore subscriber: re-file an item whenever it changes."""
+        with self._lock:
+            self._remove(item_id)
+            if new and new.get("status") == "APPROVED":
+                self._insert(item_id, new)
+
+    def _insert(self, item_id, item):
+        entry = (item_timestamp(item), item_id)
+        keys = self._keys(item)
+        for key in keys:
+            bisect.insort(self._buckets.setdefault(key, []), entry)
+        self._positions[item_id] = (entry, keys)
+
+    def _remove(self, item_id):
+        filed = self._positions.pop(item_id, None)
+        if not filed:
+            return
+        entry, keys = filed
+        for key in keys:
+            bucket = self._buckets.get(key, [])
+            i = bisect.bisect_left(bucket, entry)
+            if i < len(bucket) and bucket[i] == entry:
+                del bucket[i]
+
+    def __len__(self):
+        return len(self._positions)
+
+    def latest(self, limit, category=None, item_type=None):
+        """IDs of the newest approved items, newest first."""
+        with self._lock:
+            if category:
+                bucket = self._buckets.get(("category", category), [])
+            elif item_type:
+                bucket = self._buckets.get(("type", item_type), [])
+            else:
+                bucket = self._buckets.get(("all", ""), [])
+
+            if not (category and item_type):
+                return [item_id for _, item_id in reversed(bucket[-limit:])]
+
+            # Both filters: walk the category bucket from the newest end
+            ids = []
+            for _, item_id in reversed(bucket):
+                if ("type", item_type) in self._positions[item_id][1]:
+                    ids.append(item_id)
+                    if len(ids) == limit:
+                        break
+            return ids
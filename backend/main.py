@@ -1,20 +1,57 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from typing import Optional, Literal, List
 import firebase_admin
-from firebase_admin import credentials, db
+from firebase_admin import credentials, db, auth
 import os
 import json
 from openai import OpenAI
 import cloudinary
 import cloudinary.uploader
 import uuid
+import base64
+import hashlib
+import random
+import asyncio
+import anyio
+import time
+import re
+import datetime
+import contextvars
+
+from suggest import PrefixIndex
+from campus import location_match
+from prescreen import prescreen, stats as prescreen_stats
+from value_model import ValueClassifier
+import archive
+import export
+from dedup import dhash
+from upload_index import UploadIndex
+import tracing
+import admin_actions
+import tenancy
+from search_context import resolve_aliases
+from tracing import span, Profiler
 
 # Import AI config
 from ai_config import (
     AI_ENABLED, OPENAI_API_KEY,
     TEXT_MODEL, VISION_MODEL, IMAGE_MOD_MODEL,
     CLAIM_REVIEW_MODEL, VALUE_THRESHOLD,
+    SUGGEST_REFRESH_SECONDS, SUGGEST_LIMIT, CAMPUS_LOCATIONS,
+    CLAIM_PRESCORE_ENABLED, CLAIM_LOCATION_MISMATCH, CLAIM_STRONG_KEYWORDS,
+    PRESCREEN_ENABLED, VALUE_CONFIDENCE_THRESHOLD,
+    ARCHIVE_POLICIES, ARCHIVE_BATCH_SIZE, EXPORT_PAGE_SIZE,
+    DEDUP_TEXT_THRESHOLD, DEDUP_MIN_SHARED_WORDS, DEDUP_IMAGE_DISTANCE,
+    UPLOAD_INDEX_PATH, SLOW_REQUEST_MS, PROFILE_SLOW_REQUESTS,
+    PROFILE_SAMPLE_RATE, PROFILE_INTERVAL_MS, PROFILE_RING_SIZE,
+    ADMIN_ACTIONS_MAX, ITEM_LISTENER_ENABLED, ITEM_LISTENER_RETRY_SECONDS, ITEM_STORE_REFRESH_SECONDS,
+    FEED_DEFAULT_LIMIT, FEED_MAX_LIMIT,
+    FIREBASE_DB_URL, CAMPUSES, DEFAULT_CAMPUS, AI_CONCURRENCY_PER_CAMPUS, AI_QUOTA_WAIT_SECONDS,
+    SEARCH_CONTEXT_TOKENS, SEARCH_MAX_CANDIDATES,
     CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET
 )
 
@@ -27,8 +64,57 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+profiler = Profiler(PROFILE_INTERVAL_MS, PROFILE_RING_SIZE)
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Report per-span timings as Server-Timing and keep profiles of sampled slow requests"""
+    trace, token = tracing.start(request.method, request.url.path)
+    profiled = PROFILE_SLOW_REQUESTS and random.random() < PROFILE_SAMPLE_RATE
+    if profiled:
+        profiler.begin(trace)
+    try:
+        response = await call_next(request)
+    finally:
+        total_ms = trace.elapsed_ms()
+        if profiled:
+            profiler.end(trace, total_ms, SLOW_REQUEST_MS)
+        tracing.finish(token)
+
+    response.headers["Server-Timing"] = trace.server_timing(total_ms)
+    response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+
+# Uploaded image content hashes (persisted) and perceptual hashes keyed by URL
+upload_index = UploadIndex(UPLOAD_INDEX_PATH)
+image_hashes = {
+    entry["url"]: int(entry["imageHash"], 16)
+    for entry in upload_index.entries() if entry.get("imageHash")
+}
+
+
+campuses = tenancy.CampusRegistry(CAMPUSES, DEFAULT_CAMPUS, AI_CONCURRENCY_PER_CAMPUS, image_hashes)
+
+
+@app.middleware("http")
+async def route_campus(request: Request, call_next):
+    """Pick the campus for this request from the X-Campus-Id header or the subdomain"""
+    try:
+        campus_id = campuses.resolve(request.headers.get("x-campus-id"), request.headers.get("host"))
+    except tenancy.UnknownCampus:
+        return JSONResponse(status_code=404, content={"detail": "Unknown campus"})
+    token = tenancy.activate(campus_id)
+    try:
+        return await call_next(request)
+    finally:
+        tenancy.deactivate(token)
+
+
 # Firebase Init
 firebase_creds_json = os.environ.get("FIREBASE_CREDENTIALS")
 
@@ -37,7 +123,7 @@ if firebase_creds_json:
         cred_dict = json.loads(firebase_creds_json)
         cred = credentials.Certificate(cred_dict)
         firebase_admin.initialize_app(cred, {
-            'databaseURL': 'https://fblalf-default-rtdb.firebaseio.com/',
+            'databaseURL': FIREBASE_DB_URL,
             'storageBucket': 'fblalf.appspot.com'
         })
         print("Firebase initialized via Environment Variable")
@@ -54,7 +140,7 @@ else:
     if cred_path:
         cred = credentials.Certificate(cred_path)
         firebase_admin.initialize_app(cred, {
-            'databaseURL': 'https://fblalf-default-rtdb.firebaseio.com/',
+            'databaseURL': FIREBASE_DB_URL,
             'storageBucket': 'fblalf.appspot.com'
         })
         print(f"Firebase initialized from file: {cred_path}")
@@ -72,6 +158,129 @@ cloudinary.config(
     secure=True
 )
 
+def campus():
+    """State of the campus the current request belongs to"""
+    return campuses.get(tenancy.current_id(DEFAULT_CAMPUS))
+
+
+def ref(path=""):
+    """Database reference inside the current campus"""
+    return db.reference(campus().path(path))
+
+
+# Whether the code running now holds one of its campus's AI slots (see run_with_ai_slot)
+_ai_slot_held = contextvars.ContextVar("ai_slot_held", default=False)
+
+
+async def run_with_ai_slot(fn, *args):
+    """Run a blocking AI handler in the threadpool once a campus AI slot is free.
+
+    The wait happens here on the event loop, so a campus at its quota queues
+    requests without tying up worker threads. If no slot frees up within
+    AI_QUOTA_WAIT_SECONDS the handler still runs, and chat_completion raises
+    so it takes its usual fallback.
+    """
+    slots = campus().ai_slots
+    borrower = object()
+    acquired = False
+    with anyio.move_on_after(AI_QUOTA_WAIT_SECONDS):
+        await slots.acquire_on_behalf_of(borrower)
+        acquired = True
+    held = _ai_slot_held.set(acquired)
+    try:
+        # Run in the threadpool with this request's campus and trace context
+        context = contextvars.copy_context()
+        return await run_in_threadpool(context.run, fn, *args)
+    finally:
+        _ai_slot_held.reset(held)
+        if acquired:
+            slots.release_on_behalf_of(borrower)
+
+
+def chat_completion(**kwargs):
+    """OpenAI chat completion, timed as the "openai" span.
+
+    Only call it from a handler started by run_with_ai_slot, which holds the
+    campus's concurrency slot for it.
+    """
+    if not _ai_slot_held.get():
+        raise RuntimeError(f"AI concurrency quota exhausted for campus {campus().id}")
+    with span("openai"):
+        return openai_client.chat.completions.create(**kwargs)
+
+
+def fetch(path):
+    """Read a database path in the current campus, timed as the "firebase" span"""
+    with span("firebase"):
+        return ref(path).get()
+
+
+def get_item_store():
+    """Return the campus's `items` mirror.
+
+    The mirror follows a listener when one is running; without one (disabled,
+    or failed and waiting to retry) it is re-fetched every ITEM_STORE_REFRESH_SECONDS.
+    """
+    state = campus()
+    now = time.time()
+    with state.lock:
+        if (
+            not state.listener and ITEM_LISTENER_ENABLED and firebase_admin._apps
+            and now >= state.listener_retry_at
+        ):
+            try:
+                state.listener = ref('items').listen(state.item_store.apply_event)
+            except Exception as e:
+                print(f"Item listener error ({state.id}): {e}")
+                state.listener = None
+                state.listener_retry_at = now + ITEM_LISTENER_RETRY_SECONDS
+        stale = not state.listener and now - state.loaded_at > ITEM_STORE_REFRESH_SECONDS
+        if not state.item_store.ready or stale:
+            # Mark the attempt even if it fails, so a database outage is not retried on every request
+            state.loaded_at = now
+            try:
+                state.item_store.load(fetch('items') or {})
+            except Exception as e:
+                print(f"Item store load error ({state.id}): {e}")
+    return state.item_store
+
+
+def verify_user(authorization: Optional[str] = Header(None)):
+    """Decoded Firebase ID token from `Authorization: Bearer <token>` (401 if missing or invalid)"""
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Sign in required")
+    try:
+        return auth.verify_id_token(authorization[len("Bearer "):])
+    except Exception as e:
+        print(f"Token verification error: {e}")
+        raise HTTPException(status_code=401, detail="Invalid or expired sign-in")
+
+
+def require_admin(user: dict = Depends(verify_user)):
+    """Signed-in user whose users/<uid>/role is ADMIN (403 otherwise)"""
+    try:
+        role = fetch(f'users/{user["uid"]}/role')
+    except Exception as e:
+        print(f"Role lookup error: {e}")
+        raise HTTPException(status_code=500, detail="Could not check admin role")
+    if role != 'ADMIN':
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user
+
+
+# Local value classifier, trained on seed data plus any saved admin overrides
+value_classifier = ValueClassifier()
+for state in campuses.all():
+    try:
+        for override in (db.reference(state.path('valueOverrides')).get() or {}).values():
+            value_classifier.add_override(
+                override.get('title', ''), override.get('description', ''),
+                override.get('category', ''), override.get('highValue', False), refit=False
+            )
+    except Exception as e:
+        print(f"Could not load value overrides ({state.id}): {e}")
+value_classifier.fit()
+
 
 # --- Models ---
 class DescribeRequest(BaseModel):
@@ -96,9 +305,43 @@ class ValueEvaluationRequest(BaseModel):
     description: str
     category: str
 
+class ValueOverrideRequest(BaseModel):
+    item_id: Optional[str] = None
+    title: str
+    description: str = ""
+    category: str = ""
+    highValue: bool
+
+class DuplicateCheckRequest(BaseModel):
+    title: str
+    description: str = ""
+    type: Optional[str] = None
+    image_url: Optional[str] = None
+    image_hash: Optional[str] = None  # hex dHash returned by /api/upload-image
+    item_id: Optional[str] = None
+
+class AdminOperation(BaseModel):
+    op: Literal["set_item_status", "resolve_claim", "reply_inquiry", "delete_item", "notify"]
+    item_id: Optional[str] = None
+    claim_id: Optional[str] = None
+    inquiry_id: Optional[str] = None
+    user_id: Optional[str] = None
+    status: Optional[str] = None
+    notify: Optional[bool] = None
+    type: Optional[str] = None
+    title: Optional[str] = None
+    message: Optional[str] = None
+    pickupLocation: Optional[str] = None
+    pickupCode: Optional[str] = None
+    high_value: Optional[bool] = None
+
+class AdminActionsRequest(BaseModel):
+    operations: List[AdminOperation]
+
 class ClaimReviewRequest(BaseModel):
     item_id: str
     claim_id: str
+    force: bool = False
 
 
 # --- Endpoints ---
@@ -110,46 +353,114 @@ def health_check():
         "ai_enabled": AI_ENABLED and openai_client is not None,
         "service": "Marvin Ridge Lost & Found Backend",
         "text_model": TEXT_MODEL,
-        "vision_model": VISION_MODEL
+        "vision_model": VISION_MODEL,
+        "campus": campus().id,
+        "moderation_prescreen": prescreen_stats()
     }
 
 
+@app.get("/api/campus")
+def current_campus():
+    """The campus this request was routed to"""
+    state = campus()
+    return {"id": state.id, "name": state.name}
+
+
 @app.get("/api/ai-status")
 def ai_status():
     return {"ai_enabled": AI_ENABLED and openai_client is not None}
 
 
 @app.post("/api/upload-image")
-async def upload_image(request: ImageUploadRequest):
+def upload_image(request: ImageUploadRequest):
     try:
         image_data = request.image_base64
 
         if "," in image_data:
             image_data = image_data.split(",")[1]
 
+        image_bytes = base64.b64decode(image_data)
+        digest = hashlib.sha256(image_bytes).hexdigest()
+
+        existing = upload_index.acquire(digest)
+        if existing:
+            return {
+                "url": existing["url"],
+                "public_id": existing["public_id"],
+                "imageHash": existing.get("imageHash"),
+                "deduplicated": True
+            }
+
+        image_hash = dhash(image_bytes)
+
         public_id = f"lostfound/{uuid.uuid4().hex[:12]}"
 
-        result = cloudinary.uploader.upload(
-            f"data:image/jpeg;base64,{image_data}",
-            public_id=public_id,
-            folder="marvin_ridge_lf"
-        )
+        with span("cloudinary"):
+            result = cloudinary.uploader.upload(
+                f"data:image/jpeg;base64,{image_data}",
+                public_id=public_id,
+                folder="marvin_ridge_lf"
+            )
+
+        image_hash_hex = f"{image_hash:016x}" if image_hash is not None else None
+        if image_hash is not None:
+            image_hashes[result["secure_url"]] = image_hash
+        upload_index.put(digest, result["public_id"], result["secure_url"], image_hash_hex)
 
-        return {"url": result["secure_url"], "public_id": result["public_id"]}
+        return {
+            "url": result["secure_url"],
+            "public_id": result["public_id"],
+            "imageHash": image_hash_hex,
+            "deduplicated": False
+        }
 
     except Exception as e:
         print(f"Upload error: {e}")
         raise HTTPException(status_code=500, detail="Failed to upload image")
 
 
+def release_upload(public_id):
+    """Drop one listing's use of an uploaded asset; delete it from Cloudinary once nothing else uses it"""
+    urls = [e.get("url") for e in upload_index.entries() if e.get("public_id") == public_id]
+    remaining = upload_index.release(public_id)
+    if remaining:
+        return {"deleted": False, "references": remaining}
+
+    with span("cloudinary"):
+        result = cloudinary.uploader.destroy(public_id)
+
+    for url in urls:
+        image_hashes.pop(url, None)
+    return {"deleted": result.get("result") == "ok", "references": 0}
+
+
+@app.delete("/api/admin/upload/{public_id:path}", dependencies=[Depends(require_admin)])
+def delete_upload(public_id: str):
+    """Release one listing's use of an uploaded asset"""
+    try:
+        return release_upload(public_id)
+    except Exception as e:
+        print(f"Cloudinary delete error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete image")
+
+
 @app.post("/api/moderate-content")
 async def moderate_content(request: ModerationRequest):
     """AI text moderation using GPT-4.1-nano (cheapest, fastest)"""
+    if PRESCREEN_ENABLED:
+        verdict = prescreen(request.title, request.description, request.category)
+        if verdict:
+            return verdict
+
     if not AI_ENABLED or not openai_client:
         return {"approved": True, "reason": "AI moderation disabled"}
 
+    return await run_with_ai_slot(review_content, request)
+
+
+def review_content(request: ModerationRequest):
     try:
-        completion = openai_client.chat.completions.create(
+        completion = chat_completion(
             model=TEXT_MODEL,
             messages=[
                 {
@@ -200,8 +511,12 @@ async def moderate_image(request: ImageModerationRequest):
     if not AI_ENABLED or not openai_client:
         return {"approved": True, "reason": "Image moderation disabled"}
 
+    return await run_with_ai_slot(review_image, request)
+
+
+def review_image(request: ImageModerationRequest):
     try:
-        completion = openai_client.chat.completions.create(
+        completion = chat_completion(
             model=IMAGE_MOD_MODEL,
             messages=[
                 {
@@ -264,11 +579,18 @@ REASON: brief explanation (one sentence)"""
 @app.post("/api/evaluate-value")
 async def evaluate_value(request: ValueEvaluationRequest):
     """AI determines if an item is high value ($50+) for a high school setting."""
-    if not AI_ENABLED or not openai_client:
-        return {"highValue": False, "reason": "AI disabled, defaulting to low value"}
+    high_value, confidence, reason = value_classifier.predict(request.title, request.description, request.category)
+    local_result = {"highValue": high_value, "reason": reason, "confidence": confidence}
+
+    if confidence >= VALUE_CONFIDENCE_THRESHOLD or not AI_ENABLED or not openai_client:
+        return local_result
 
+    return await run_with_ai_slot(estimate_value, request, local_result)
+
+
+def estimate_value(request: ValueEvaluationRequest, local_result):
     try:
-        completion = openai_client.chat.completions.create(
+        completion = chat_completion(
             model=TEXT_MODEL,
             messages=[
                 {
@@ -306,11 +628,106 @@ REASON: one sentence explanation"""
             elif 'REASON:' in line.upper():
                 reason = line.split(':', 1)[1].strip() if ':' in line else reason
 
-        return {"highValue": high_value, "reason": reason}
+        return {"highValue": high_value, "reason": reason, "confidence": None}
 
     except Exception as e:
         print(f"Value evaluation error: {e}")
-        return {"highValue": False, "reason": "Evaluation failed, defaulting to low value"}
+        return local_result
+
+
+@app.post("/api/admin/value-override", dependencies=[Depends(require_admin)])
+def value_override(request: ValueOverrideRequest):
+    """Record an admin's high-value decision and retrain the local classifier on it."""
+    override = {
+        "title": request.title,
+        "description": request.description,
+        "category": request.category,
+        "highValue": request.highValue,
+    }
+    try:
+        ref('valueOverrides').push(override)
+        if request.item_id:
+            ref(f'items/{request.item_id}').update({'highValue': request.highValue})
+    except Exception as e:
+        print(f"Value override save error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to save override")
+
+    value_classifier.add_override(request.title, request.description, request.category, request.highValue)
+    high_value, confidence, _ = value_classifier.predict(request.title, request.description, request.category)
+    return {"saved": True, "prediction": {"highValue": high_value, "confidence": confidence}}
+
+
+_KEYWORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def claim_keywords(text):
+    """Distinctive words in a description (same >3 letter rule the dashboard matcher uses)"""
+    return {w for w in _KEYWORD_RE.findall((text or "").lower()) if len(w) > 3}
+
+
+def prescore_claim(item_data, claim_data, location_score, location_reason, location_certain=True):
+    """Decide clear-cut claims locally. Returns (approved, confidence, reason) or None if ambiguous."""
+    if location_score is None or not location_certain:
+        return None
+
+    if location_score <= CLAIM_LOCATION_MISMATCH:
+        return False, 90, f"Claimed location does not match where the item was found ({location_reason})."
+
+    # Title, description and location are shown on the item page, so a claim that only
+    # repeats them proves nothing; approve locally only on evidence the public can't see.
+    public_words = claim_keywords(' '.join(str(item_data.get(k) or '') for k in ('title', 'category', 'location', 'description')))
+    claimed_words = claim_keywords(claim_data.get('claimedDescription', ''))
+    proof_words = claim_keywords(claim_data.get('additionalProof', ''))
+    matched = public_words & claimed_words
+    private_proof = bool(claim_data.get('proofImageUrls')) or (
+        len(proof_words) >= CLAIM_STRONG_KEYWORDS and not proof_words & public_words)
+
+    if location_score >= 1.0 and private_proof and len(matched) >= CLAIM_STRONG_KEYWORDS:
+        return True, 80, f"Location matches ({location_reason}), description matches item details ({', '.join(sorted(matched)[:5])}) and proof goes beyond the public listing."
+
+    return None
+
+
+def claim_review_hash(item_data, claim_data):
+    """Hash of everything a claim review looks at; a stored review with the same hash is still valid."""
+    fields = {
+        'item': [item_data.get(k, '') for k in ('title', 'category', 'location', 'description')],
+        'claim': [claim_data.get(k) or '' for k in ('claimedLocation', 'claimedDescription', 'additionalProof')],
+        'proofImages': claim_data.get('proofImageUrls') or [],
+    }
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def claim_review_response(review, cached=False):
+    return {
+        "approved": review['approved'],
+        "reason": review['reason'],
+        "confidence": review['confidence'],
+        "needsAdminReview": review['confidence'] < 70,
+        "cached": cached
+    }
+
+
+def store_claim_review(claim_ref, approved, reason, confidence, reviewed_by, input_hash):
+    """Write the review onto the claim and build the endpoint response."""
+    needs_admin = confidence < 70
+
+    review = {
+        'approved': approved,
+        'reason': reason,
+        'confidence': confidence,
+        'reviewedBy': reviewed_by,
+        'inputHash': input_hash,
+        'reviewedAt': datetime.datetime.now().isoformat()
+    }
+    with span("firebase"):
+        claim_ref.update({
+            'aiReview': review,
+            'status': 'AI_APPROVED' if (approved and not needs_admin) else
+                      'AI_REJECTED' if (not approved and not needs_admin) else 'PENDING'
+        })
+
+    return claim_review_response(review)
 
 
 @app.post("/api/ai-review-claim")
@@ -324,17 +741,57 @@ async def ai_review_claim(request: ClaimReviewRequest):
             "needsAdminReview": True
         }
 
+    # Concurrent duplicate calls for the same claim share one evaluation
+    in_flight = campus().claim_reviews_in_flight
+    key = (request.claim_id, request.item_id, request.force)
+    while key in in_flight:
+        pending = in_flight[key]
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this request was cancelled, not the one it was waiting on
+            # The request doing the review went away (client disconnect); take over
+
+    future = asyncio.get_running_loop().create_future()
+    in_flight[key] = future
+    try:
+        result = await run_with_ai_slot(review_claim, request.item_id, request.claim_id, request.force)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    finally:
+        # Cancellation is not an Exception; never leave waiters on an unresolved future
+        if not future.done():
+            future.cancel()
+        if in_flight.get(key) is future:
+            del in_flight[key]
+
+
+def review_claim(item_id, claim_id, force=False):
+    """Review one claim, reusing the stored review when neither the claim nor the item has changed."""
     try:
-        item_ref = db.reference(f'items/{request.item_id}')
-        item_data = item_ref.get()
+        store = campus().item_store
+        item_data = store.get(item_id) if store.ready else None
+        if not item_data:
+            item_data = fetch(f'items/{item_id}')
         if not item_data:
             raise HTTPException(status_code=404, detail="Item not found")
 
-        claim_ref = db.reference(f'claims/{request.claim_id}')
-        claim_data = claim_ref.get()
+        claim_ref = ref(f'claims/{claim_id}')
+        with span("firebase"):
+            claim_data = claim_ref.get()
         if not claim_data:
             raise HTTPException(status_code=404, detail="Claim not found")
 
+        input_hash = claim_review_hash(item_data, claim_data)
+        existing = claim_data.get('aiReview')
+        if not force and existing and existing.get('inputHash') == input_hash:
+            return claim_review_response(existing, cached=True)
+
         actual_location = item_data.get('location', 'Unknown')
         actual_description = item_data.get('description', '')
         actual_title = item_data.get('title', '')
@@ -344,7 +801,20 @@ async def ai_review_claim(request: ClaimReviewRequest):
         claimed_description = claim_data.get('claimedDescription', '')
         additional_proof = claim_data.get('additionalProof', '')
 
-        completion = openai_client.chat.completions.create(
+        location_score, location_reason, location_certain = location_match(actual_location, claimed_location)
+
+        if CLAIM_PRESCORE_ENABLED:
+            decision = prescore_claim(item_data, claim_data, location_score, location_reason, location_certain)
+            if decision:
+                approved, confidence, reason = decision
+                return store_claim_review(claim_ref, approved, reason, confidence, "rules", input_hash)
+
+        location_hint = (
+            f"{location_reason} (score {location_score:.1f})" if location_score is not None
+            else "not recognized by campus gazetteer"
+        )
+
+        completion = chat_completion(
             model=CLAIM_REVIEW_MODEL,
             messages=[
                 {
@@ -385,50 +855,34 @@ Description: {actual_description}
 CLAIMANT'S ANSWERS:
 Guessed Location: {claimed_location}
 Item Description: {claimed_description}
-Additional Proof: {additional_proof or 'None provided'}"""
+Additional Proof: {additional_proof or 'None provided'}
+
+CAMPUS LOCATION CHECK: {location_hint}"""
                 }
             ],
             temperature=0.2,
             max_completion_tokens=200
         )
 
-        output = completion.choices[0].message.content
-        approved = False
-        confidence = 0
-        reason = "Unable to evaluate"
-
-        for line in output.split('\n'):
-            if 'APPROVED:' in line.upper():
-                approved = 'true' in line.lower()
-            elif 'CONFIDENCE:' in line.upper():
-                try:
-                    conf_str = line.split(':', 1)[1].strip()
-                    confidence = int(''.join(c for c in conf_str if c.isdigit())[:3])
-                except:
-                    confidence = 0
-            elif 'REASON:' in line.upper():
-                reason = line.split(':', 1)[1].strip() if ':' in line else reason
-
-        needs_admin = confidence < 70
-
-        import datetime
-        claim_ref.update({
-            'aiReview': {
-                'approved': approved,
-                'reason': reason,
-                'confidence': confidence,
-                'reviewedAt': datetime.datetime.now().isoformat()
-            },
-            'status': 'AI_APPROVED' if (approved and not needs_admin) else
-                      'AI_REJECTED' if (not approved and not needs_admin) else 'PENDING'
-        })
-
-        return {
-            "approved": approved,
-            "reason": reason,
-            "confidence": confidence,
-            "needsAdminReview": needs_admin
-        }
+        with span("parse"):
+            output = completion.choices[0].message.content
+            approved = False
+            confidence = 0
+            reason = "Unable to evaluate"
+
+            for line in output.split('\n'):
+                if 'APPROVED:' in line.upper():
+                    approved = 'true' in line.lower()
+                elif 'CONFIDENCE:' in line.upper():
+                    try:
+                        conf_str = line.split(':', 1)[1].strip()
+                        confidence = int(''.join(c for c in conf_str if c.isdigit())[:3])
+                    except:
+                        confidence = 0
+                elif 'REASON:' in line.upper():
+                    reason = line.split(':', 1)[1].strip() if ':' in line else reason
+
+        return store_claim_review(claim_ref, approved, reason, confidence, "ai", input_hash)
 
     except HTTPException:
         raise
@@ -446,37 +900,26 @@ Additional Proof: {additional_proof or 'None provided'}"""
 async def ai_search(request: SearchRequest):
     """AI-powered search using GPT-4.1-nano (cheapest, fastest)"""
     if not AI_ENABLED or not openai_client:
-        return fallback_search(request.query)
+        return await run_in_threadpool(contextvars.copy_context().run, fallback_search, request.query)
 
-    try:
-        items_ref = db.reference('items')
-        items_data = items_ref.get()
+    return await run_with_ai_slot(search_items, request)
 
-        if not items_data:
-            return {"results": [], "corrected_query": request.query}
 
-        items_list = []
-        for item_id, item in items_data.items():
-            if item.get('status') == 'APPROVED':
-                items_list.append({
-                    "id": item_id,
-                    "title": item.get('title', ''),
-                    "description": item.get('description', ''),
-                    "type": item.get('type', ''),
-                    "category": item.get('category', ''),
-                    "location": item.get('location', ''),
-                    "imageUrl": item.get('imageUrl', '')
-                })
-
-        if not items_list:
+def search_items(request: SearchRequest):
+    try:
+        get_item_store()
+        search_context = campus().search_context
+
+        if not len(search_context):
             return {"results": [], "corrected_query": request.query}
 
-        items_context = "\n".join([
-            f"ID:{i['id']} | {i['title']} | {i['category']} | {i['location']}"
-            for i in items_list[:30]
-        ])
+        with span("prompt"):
+            # Cached per-item lines, best matches first, under short aliases
+            items_context, aliases = search_context.pack(
+                request.query, SEARCH_CONTEXT_TOKENS, SEARCH_MAX_CANDIDATES
+            )
 
-        completion = openai_client.chat.completions.create(
+        completion = chat_completion(
             model=TEXT_MODEL,
             messages=[
                 {
@@ -486,7 +929,7 @@ async def ai_search(request: SearchRequest):
 2. Match items from the list that are relevant.
 3. Return ONLY in this exact format:
 CORRECTED: [corrected search term]
-MATCHES: [comma-separated list of matching IDs, or "none" if no matches]"""
+MATCHES: [comma-separated list of matching item keys (the text before the colon), or "none" if no matches]"""
                 },
                 {
                     "role": "user",
@@ -497,28 +940,27 @@ MATCHES: [comma-separated list of matching IDs, or "none" if no matches]"""
             max_completion_tokens=200
         )
 
-        output = completion.choices[0].message.content
+        with span("parse"):
+            output = completion.choices[0].message.content
 
-        corrected = request.query
-        matching_ids = []
+            corrected = request.query
+            results = []
 
-        for line in output.split('\n'):
-            if line.startswith('CORRECTED:'):
-                corrected = line.replace('CORRECTED:', '').strip()
-            elif line.startswith('MATCHES:'):
-                ids_str = line.replace('MATCHES:', '').strip()
-                if ids_str.lower() != 'none':
-                    matching_ids = [id.strip() for id in ids_str.split(',') if id.strip()]
-
-        results = [item for item in items_list if item['id'] in matching_ids]
-
-        if not results:
-            search_lower = corrected.lower()
-            results = [item for item in items_list if
-                search_lower in item['title'].lower() or
-                search_lower in item['description'].lower() or
-                search_lower in item['category'].lower()
-            ]
+            for line in output.split('\n'):
+                if line.startswith('CORRECTED:'):
+                    corrected = line.replace('CORRECTED:', '').strip()
+                elif line.startswith('MATCHES:'):
+                    ids_str = line.replace('MATCHES:', '').strip()
+                    if ids_str.lower() != 'none':
+                        results = resolve_aliases(ids_str, aliases)
+
+            if not results:
+                search_lower = corrected.lower()
+                results = [item for item in search_context.records() if
+                    search_lower in item['title'].lower() or
+                    search_lower in item['description'].lower() or
+                    search_lower in item['category'].lower()
+                ]
 
         return {"results": results[:10], "corrected_query": corrected}
 
@@ -527,12 +969,96 @@ MATCHES: [comma-separated list of matching IDs, or "none" if no matches]"""
         return fallback_search(request.query)
 
 
+def get_suggest_index():
+    """Return the campus's typeahead index, rebuilding it from the item mirror when stale."""
+    state = campus()
+    if time.time() - state.suggest_index.built_at > SUGGEST_REFRESH_SECONDS:
+        try:
+            state.suggest_index = PrefixIndex.from_items(get_item_store().snapshot(), CAMPUS_LOCATIONS)
+        except Exception as e:
+            print(f"Suggest index rebuild error: {e}")
+            if not len(state.suggest_index):
+                state.suggest_index = PrefixIndex.from_items({}, CAMPUS_LOCATIONS)
+            state.suggest_index.built_at = time.time()
+    return state.suggest_index
+
+
+@app.get("/api/suggest")
+def suggest(q: str = Query("", max_length=100), limit: int = Query(SUGGEST_LIMIT, ge=1, le=20)):
+    """Typeahead suggestions from an in-memory prefix index (no AI call)"""
+    return {"query": q, "suggestions": get_suggest_index().suggest(q, limit)}
+
+
+@app.post("/api/check-duplicate")
+def check_duplicate(request: DuplicateCheckRequest, authorization: Optional[str] = Header(None)):
+    """Find likely duplicate listings before any AI calls are spent on a submission.
+
+    With item_id, the stored listing is also flagged and indexed; only its owner may do that.
+    """
+    item = None
+    if request.item_id:
+        user = verify_user(authorization)
+        try:
+            item = fetch(f'items/{request.item_id}')
+        except Exception as e:
+            print(f"Duplicate item lookup error: {e}")
+            raise HTTPException(status_code=500, detail="Failed to load item")
+        if not isinstance(item, dict):
+            raise HTTPException(status_code=404, detail="Item not found")
+        if item.get('owner') != user['uid']:
+            raise HTTPException(status_code=403, detail="Only the item's owner can flag it")
+
+    if request.image_hash:
+        try:
+            image_hash = int(request.image_hash, 16)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="image_hash must be hex")
+    else:
+        image_hash = image_hashes.get(request.image_url) if request.image_url else None
+    get_item_store()  # the index follows the item mirror
+    index = campus().duplicate_index
+    matches = index.find(
+        request.title, request.description, request.type, image_hash,
+        text_threshold=DEDUP_TEXT_THRESHOLD, min_shared=DEDUP_MIN_SHARED_WORDS,
+        image_distance=DEDUP_IMAGE_DISTANCE, exclude=request.item_id
+    )
+
+    if item is not None:
+        # Flag the stored listing for admins and keep its hashes for future checks
+        updates = {'possibleDuplicateOf': matches[0]['id'] if matches else None}
+        if image_hash is not None:
+            updates['imageHash'] = f"{image_hash:016x}"
+        try:
+            ref(f'items/{request.item_id}').update(updates)
+        except Exception as e:
+            print(f"Duplicate flag error: {e}")
+        # Don't wait for the listener to echo the write back
+        index.on_item_changed(request.item_id, item, {**item, **updates})
+
+    return {"duplicate": bool(matches), "matches": matches[:5]}
+
+
+@app.get("/api/feed")
+def feed(
+    limit: int = Query(FEED_DEFAULT_LIMIT, ge=1, le=FEED_MAX_LIMIT),
+    category: Optional[str] = None,
+    type: Optional[str] = None
+):
+    """Newest approved items, optionally per category and/or type, from the live recency index"""
+    store = get_item_store()
+    results = []
+    for item_id in campus().recency_feed.latest(limit, category, type):
+        item = store.get(item_id)
+        if item:
+            results.append({"id": item_id, **item})
+    return {"results": results}
+
+
 def fallback_search(query: str):
     """Fallback to simple text search"""
     try:
         search_lower = query.lower()
-        items_ref = db.reference('items')
-        items_data = items_ref.get() or {}
+        items_data = fetch('items') or {}
 
         results = []
         for item_id, item in items_data.items():
@@ -552,8 +1078,12 @@ async def describe_image(request: DescribeRequest):
     if not AI_ENABLED or not openai_client:
         return {"description": "AI features are disabled. Please describe the item manually."}
 
+    return await run_with_ai_slot(describe_item, request)
+
+
+def describe_item(request: DescribeRequest):
     try:
-        completion = openai_client.chat.completions.create(
+        completion = chat_completion(
             model=VISION_MODEL,
             messages=[
                 {
@@ -584,6 +1114,156 @@ async def describe_image(request: DescribeRequest):
         return {"description": "Unable to analyze image. Please describe the item manually."}
 
 
+@app.post("/api/admin/archive/run", dependencies=[Depends(require_admin)])
+def run_archive(dry_run: bool = False):
+    """Move records past the archive policy out of the live tree (dry_run lists them only)"""
+    try:
+        moved = archive.run_archive(ref(), ARCHIVE_POLICIES, ARCHIVE_BATCH_SIZE, dry_run)
+    except Exception as e:
+        print(f"Archive error: {e}")
+        raise HTTPException(status_code=500, detail="Archive run failed")
+    return {
+        "dry_run": dry_run,
+        "archived": {collection: len(ids) for collection, ids in moved.items()},
+        "ids": moved
+    }
+
+
+@app.get("/api/admin/archive/{collection}", dependencies=[Depends(require_admin)])
+def list_archive(
+    collection: str,
+    limit: int = Query(50, ge=1, le=500),
+    start_after: Optional[str] = None,
+    status: Optional[str] = None
+):
+    """Page through archived records of a collection"""
+    if collection not in ARCHIVE_POLICIES:
+        raise HTTPException(status_code=404, detail="Unknown archive collection")
+    try:
+        return archive.query_archive(ref(), collection, limit, start_after, status)
+    except Exception as e:
+        print(f"Archive query error: {e}")
+        raise HTTPException(status_code=500, detail="Archive query failed")
+
+
+@app.get("/api/admin/archive/{collection}/{record_id}", dependencies=[Depends(require_admin)])
+def get_archived(collection: str, record_id: str):
+    """Fetch a single archived record"""
+    if collection not in ARCHIVE_POLICIES:
+        raise HTTPException(status_code=404, detail="Unknown archive collection")
+    record = fetch(f'{archive.ARCHIVE_ROOT}/{collection}/{record_id}')
+    if not record:
+        raise HTTPException(status_code=404, detail="Archived record not found")
+    return {"id": record_id, **record}
+
+
+def linked_item_flags(item_ids, store, archived_items):
+    """highValue of each item id: from the live mirror, else from that item's archived record"""
+    flags = {}
+    for item_id in item_ids:
+        item = store.get(item_id)
+        if item is None:
+            with span("firebase"):
+                item = {'highValue': archived_items.child(f'{item_id}/highValue').get()}
+        if isinstance(item, dict):
+            flags[item_id] = item.get('highValue')
+    return flags
+
+
+@app.get("/api/admin/export/{collection}", dependencies=[Depends(require_admin)])
+def export_collection(
+    collection: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status: Optional[str] = None,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    high_value: Optional[bool] = None,
+    archived: bool = False
+):
+    """Stream a collection (or its archive) as NDJSON or CSV, filtered on the way out"""
+    if collection not in export.EXPORT_COLUMNS:
+        raise HTTPException(status_code=404, detail="Unknown export collection")
+
+    path = f"{archive.ARCHIVE_ROOT}/{collection}" if archived else collection
+    high_value_of = None
+    if high_value is not None and collection in export.ITEM_LINKED:
+        # Claims and inquiries take highValue from their item, live or archived. Bound
+        # here because the lookups run later, while the response streams.
+        store, archived_items = get_item_store(), ref(f'{archive.ARCHIVE_ROOT}/items')
+        high_value_of = export.LinkedHighValue(lambda ids: linked_item_flags(ids, store, archived_items))
+    keep = export.make_filter(status, date_from, date_to, high_value, high_value_of)
+    chunks = export.export_stream(
+        ref(path), collection, format, keep, EXPORT_PAGE_SIZE,
+        on_page=high_value_of.load if high_value_of else None
+    )
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    extension = "csv" if format == "csv" else "ndjson"
+    filename = f"{'archive-' if archived else ''}{collection}-{datetime.date.today().isoformat()}.{extension}"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@app.post("/api/admin/actions", dependencies=[Depends(require_admin)])
+def run_admin_actions(request: AdminActionsRequest):
+    """Apply a batch of admin operations as one atomic multi-path update, with per-operation results"""
+    if len(request.operations) > ADMIN_ACTIONS_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {ADMIN_ACTIONS_MAX} operations per request")
+
+    operations = [op.model_dump(exclude_none=True) for op in request.operations]
+    try:
+        with span("firebase"):
+            results, writes = admin_actions.apply(operations, ref())
+    except Exception as e:
+        print(f"Admin actions error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to apply admin actions")
+
+    # Deleted listings no longer hold their uploaded image
+    for result in results:
+        public_id = upload_index.public_id_for(result["imageUrl"]) if result["ok"] and result.get("imageUrl") else None
+        if public_id:
+            try:
+                release_upload(public_id)
+            except Exception as e:
+                print(f"Upload release error: {e}")
+
+    return {"applied": writes > 0, "writes": writes, "results": results}
+
+
+@app.post("/api/items/{item_id}/claim")
+def claim_item(item_id: str, user: dict = Depends(verify_user)):
+    """Claim a low-value found item directly: notify the student and archive the item in one write"""
+    try:
+        with span("firebase"):
+            results, _ = admin_actions.apply(
+                [{"op": "claim_item", "item_id": item_id, "user_id": user["uid"]}], ref()
+            )
+    except Exception as e:
+        print(f"Item claim error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to claim item")
+
+    if not results[0]["ok"]:
+        raise HTTPException(status_code=409, detail=results[0]["error"])
+    return {"claimed": True, "pickupLocation": results[0].get("pickupLocation")}
+
+
+@app.get("/api/admin/slow-requests", dependencies=[Depends(require_admin)])
+def slow_requests(stacks: bool = False):
+    """Profile snapshots of recent slow requests, newest first"""
+    snapshots = list(reversed(profiler.snapshots))
+    if not stacks:
+        snapshots = [{k: v for k, v in snap.items() if k not in ("stacks", "request_stacks")} for snap in snapshots]
+    return {
+        "enabled": PROFILE_SLOW_REQUESTS,
+        "threshold_ms": SLOW_REQUEST_MS,
+        "sample_rate": PROFILE_SAMPLE_RATE,
+        "snapshots": snapshots
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,195 @@
+"""Local pre-screen for text moderation.
+
+Clear-cut submissions are decided here with a handful of compiled
+regexes; anything uncertain returns None and goes to the LLM moderator.
+Text is only approved locally when every word is ordinary item-report
+vocabulary, so names, insults and sales pitches always reach the model.
+"""
+
+import re
+import threading
+
+# Profanity and slurs. Matched as whole words, with common letter swaps.
+PROFANITY = [
+    "fuck", "fucking", "fucker", "shit", "shitty", "bitch", "bastard", "asshole",
+    "cunt", "slut", "whore", "retard", "retarded",
+    "fag", "faggot", "dyke", "tranny",
+]
+
+# Items that cannot be listed on a school lost and found
+BLOCKED_ITEMS = [
+    "handgun", "pistol", "rifle", "ammo", "ammunition", "switchblade", "brass knuckles", "taser",
+    "vape", "vapes", "vape pen", "juul", "marijuana", "cannabis", "cocaine",
+    "cigarette", "cigarettes", "vodka", "condom",
+]
+
+# Words that are usually something harmless ("bullet journal", "glue gun", "lighter blue");
+# these send the submission to the model instead of rejecting it
+AMBIGUOUS_ITEMS = [
+    "gun", "bullet", "bullets", "knife", "pepper spray", "weed", "edible", "edibles",
+    "meth", "lighter", "alcohol", "beer",
+]
+
+# Words that show the submission is describing an actual lost/found item
+ITEM_NOUNS = [
+    "airpods", "earbuds", "headphones", "phone", "iphone", "android", "case", "charger", "cable",
+    "calculator", "laptop", "macbook", "chromebook", "ipad", "tablet", "watch", "mouse", "usb", "drive",
+    "bottle", "flask", "hydro", "stanley", "yeti", "cup", "tumbler", "lunch", "container",
+    "backpack", "bag", "purse", "wallet", "keys", "key", "keychain", "lanyard", "id", "card",
+    "jacket", "hoodie", "sweatshirt", "sweater", "coat", "shirt", "jersey", "hat", "cap", "beanie",
+    "glove", "gloves", "scarf", "shoe", "shoes", "sneakers", "cleats", "umbrella",
+    "glasses", "sunglasses", "earrings", "ring", "necklace", "bracelet", "jewelry",
+    "book", "textbook", "notebook", "binder", "folder", "pencil", "pen", "eraser", "ruler",
+]
+
+# Everything else a plain item report is made of. Any other word escalates.
+REPORT_WORDS = """
+a an the and or but with without of in on at near by from to for into onto over under behind
+next inside outside between around about is was were are be been it its this that these those
+i i'm my me we our you your yours their they them someone somebody one two three four five
+some few all any has have had no not only also just like looks still left right found lost
+forgot dropped please if mine belongs belonging owner claim after before during last today
+yesterday morning afternoon period class monday tuesday wednesday thursday friday weekend
+black white gray grey silver gold red blue navy green yellow orange purple pink brown tan
+beige clear dark light bright teal maroon colored color colour multicolor striped plain
+leather plastic metal metallic cloth fabric canvas denim wool cotton rubber silicone glass
+small large big little medium mini tiny long short round square rectangular compact new old
+used broken cracked scratched scratch worn torn dirty damaged missing empty full pair set
+zip zipper zippered pocket pockets strap straps logo sticker stickers design pattern brand name
+initials engraved engraving label tag wireless bluetooth pro max plus air series edition size
+oz gb tb inch graphing scientific prescription reading water sport flash sd ipod
+student students school team club varsity letterman art math english science chemistry biology
+physics history spanish french band choir ap pe exam study notes supplies computer car fob
+badge pin photo frame frames eyeglasses sleeve collar hood shorts pants sweatpants socks
+uniform boys girls women men women's men's basketball football soccer baseball softball
+volleyball tennis lacrosse mechanical sharpie marker markers highlighter calc enamel bifold
+attached hanging plugged locked lock leaning against wall corner ground fell off other
+included including contains written drawing heavily partially visible smudged sticky frayed
+stain holes sized single winter hand loop crack trash find
+cover lid handle screen band charging wired insulated lightweight hooded pullover zip-up
+apple samsung nike adidas jordan under armour north face patagonia stanley yeti jansport
+herschel ti texas instruments casio dell hp lenovo google pixel beats bose sony skullcandy
+jbl vans converse puma fitbit garmin lululemon champion columbia sandisk logitech mrhs
+room cafeteria gym aux media center library office hallway hall wing building bus lot
+parking field stadium locker lunch classroom table bench desk chair floor bathroom
+restroom auditorium commons track court area entrance bleachers front back side top bottom
+"""
+_REPORT_WORDS = set(REPORT_WORDS.split())
+
+MAX_LOCAL_LENGTH = 400  # longer descriptions always go to the model
+
+_LEET = str.maketrans({"0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "@": "a", "$": "s"})
+
+
+def _word_union(words):
+    return re.compile(r"\b(?:" + "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)) + r")\b")
+
+
+_PROFANITY_RE = _word_union(PROFANITY)
+_BLOCKED_RE = _word_union(BLOCKED_ITEMS)
+_AMBIGUOUS_RE = _word_union(AMBIGUOUS_ITEMS)
+_ITEM_RE = _word_union(ITEM_NOUNS)
+_VOCABULARY = _REPORT_WORDS | {w for noun in ITEM_NOUNS for w in noun.split()}
+_WORD_RE = re.compile(r"[a-z0-9']+")
+# Numbers and room/model codes: 84, 2nd, g100, 128gb
+_CODE_RE = re.compile(r"[a-z]{0,2}\d+[a-z]{0,3}")
+
+# A phone number: a whole 10-11 digit run (optionally separated) ...
+_PHONE_RE = re.compile(r"(?<![\w-])(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}(?![\w-])")
+# ... only counts as contact info next to words like "call me" or "my number"
+_CONTACT_RE = re.compile(r"\b(?:call|text|txt|cell|contact|reach|number|phone\s*#|phone:|hmu)\b")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+# Case-sensitive on the street name so "2 GB flash drive" is not an address. Item titles
+# ("32 Gig Flash Drive", "2 Tennis Court") still look like this, so an address ...
+_ADDRESS_RE = re.compile(
+    r"\b\d{1,5}\s+(?:[A-Z][a-z]+\s+){1,2}(?i:street|st|avenue|ave|road|rd|drive|dr|lane|ln|"
+    r"boulevard|blvd|court|ct|way|circle|cir|parkway|pkwy)\b"
+)
+# ... only counts as contact info after words like "I live at" or "bring it to my house"
+_HOME_RE = re.compile(r"\b(?:live|lives|address|house|home|apartment|apt|bring|mail|drop\s+(?:it|them)\s+off)\b")
+_URL_RE = re.compile(r"https?://|www\.|\.com\b|\.net\b")
+
+_stats = {"approved": 0, "rejected": 0, "escalated": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def stats():
+    """Counters for how many submissions were decided locally."""
+    with _stats_lock:
+        snapshot = dict(_stats)
+    total = sum(snapshot.values())
+    local = snapshot["approved"] + snapshot["rejected"]
+    snapshot["total"] = total
+    snapshot["local_share"] = round(local / total, 3) if total else 0.0
+    return snapshot
+
+
+def _contact_number(text):
+    """(phone-shaped number present, introduced as contact details)"""
+    shaped = False
+    for match in _PHONE_RE.finditer(text):
+        shaped = True
+        if _CONTACT_RE.search(text[max(0, match.start() - 25):match.start()]):
+            return True, True
+    return shaped, False
+
+
+def _contact_address(text):
+    """(street-address-shaped text present, introduced as somewhere to reach the poster)"""
+    shaped = False
+    for match in _ADDRESS_RE.finditer(text):
+        shaped = True
+        if _HOME_RE.search(text[max(0, match.start() - 30):match.start()].lower()):
+            return True, True
+    return shaped, False
+
+
+def _only_report_words(text):
+    for word in _WORD_RE.findall(text):
+        word = word.strip("'")
+        if len(word) <= 1 or word in _VOCABULARY or _CODE_RE.fullmatch(word):
+            continue
+        if word.endswith("s") and (word[:-1] in _VOCABULARY or word.endswith("es") and word[:-2] in _VOCABULARY):
+            continue
+        if word.endswith("'s") and word[:-2] in _VOCABULARY:
+            continue
+        return False
+    return True
+
+
+def prescreen(title, description, category=""):
+    """Return {"approved", "reason"} for clear-cut text, or None to escalate."""
+    text = f"{title}\n{category}\n{description}".lower()
+    squashed = text.translate(_LEET)
+
+    if _PROFANITY_RE.search(text) or _PROFANITY_RE.search(squashed):
+        _count("rejected")
+        return {"approved": False, "reason": "Submission contains inappropriate language."}
+    phone_shaped, contact_number = _contact_number(text)
+    address_shaped, contact_address = _contact_address(f"{title}\n{description}")
+    if contact_number or contact_address or _EMAIL_RE.search(text):
+        _count("rejected")
+        return {"approved": False, "reason": "Please remove personal information like phone numbers, emails or addresses."}
+    if _BLOCKED_RE.search(text):
+        _count("rejected")
+        return {"approved": False, "reason": "This item is not allowed on the school lost and found."}
+
+    if (
+        len(text) <= MAX_LOCAL_LENGTH
+        and not phone_shaped
+        and not address_shaped
+        and not _URL_RE.search(text)
+        and not _AMBIGUOUS_RE.search(text)
+        and _ITEM_RE.search(f"{title}\n{description}".lower())
+        and _only_report_words(f"{title}\n{description}".lower())
+    ):
+        _count("approved")
+        return {"approved": True, "reason": "Content approved"}
+
+    _count("escalated")
+    return None
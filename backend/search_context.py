@@ -0,0 +1,130 @@
+"""Prompt context for AI search, cached per item and packed to a token budget.
+
+Each approved item's prompt line and search record are formatted once
+and refreshed from item change events, instead of re-formatting the
+whole catalog per request. At query time candidates are ranked by
+character-trigram overlap with the query (which tolerates the typos the
+model is asked to correct), then packed into the prompt until the token
+budget is spent. Long push IDs are replaced by short per-request aliases
+and mapped back after the model answers.
+"""
+
+import re
+import threading
+
+from catalog import item_timestamp
+
+ALIAS_CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+_non_word = re.compile(r"[^a-z0-9]+")
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token for English text)."""
+    return max(1, (len(text) + 3) // 4)
+
+
+def trigrams(text):
+    words = _non_word.sub(" ", text.lower()).split()
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def alias(n):
+    """Short base-36 alias for the nth candidate."""
+    digits = ""
+    while True:
+        n, r = divmod(n, 36)
+        digits = ALIAS_CHARS[r] + digits
+        if not n:
+            return digits
+
+
+class Entry:
+    __slots__ = ("record", "line", "tokens", "grams", "ts")
+
+    def __init__(self, item_id, item):
+        self.record = {
+            "id": item_id,
+            "title": item.get("title", ""),
+            "description": item.get("description", ""),
+            "type": item.get("type", ""),
+            "category": item.get("category", ""),
+            "location": item.get("location", ""),
+            "imageUrl": item.get("imageUrl", ""),
+        }
+        r = self.record
+        self.line = f"{r['title']} | {r['category']} | {r['location']}"
+        self.tokens = estimate_tokens(self.line)
+        self.grams = trigrams(f"{r['title']} {r['category']} {r['location']} {r['description']}")
+        self.ts = item_timestamp(item)
+
+
+class SearchContext:
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def on_item_changed(self, item_id, old, new):
+        """ItemStore subscriber: reformat an item's line whenever it changes."""
+        with self._lock:
+            if new and new.get("status") == "APPROVED":
+                self._entries[item_id] = Entry(item_id, new)
+            else:
+                self._entries.pop(item_id, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def records(self):
+        with self._lock:
+            return [entry.record for entry in self._entries.values()]
+
+    def pack(self, query, token_budget, max_items=None):
+        """Best-matching candidates that fit the budget.
+
+        Returns (context text, {alias: record}).
+        """
+        query_grams = trigrams(query)
+        with self._lock:
+            entries = list(self._entries.values())
+        ranked = sorted(
+            entries,
+            key=lambda e: (len(query_grams & e.grams), e.ts),
+            reverse=True,
+        )
+
+        lines = []
+        aliases = {}
+        used = 0
+        for entry in ranked:
+            key = alias(len(aliases) + 1)
+            line = f"{key}: {entry.line}"
+            cost = entry.tokens + estimate_tokens(f"{key}: ")
+            if used + cost > token_budget:
+                # A shorter line further down may still fit
+                continue
+            lines.append(line)
+            aliases[key] = entry.record
+            used += cost
+            if max_items and len(aliases) >= max_items:
+                break
+        return "\n".join(lines), aliases
+
+
+def resolve_aliases(matches, aliases):
+    """Map the model's MATCHES list back to records, ignoring unknown aliases."""
+    results = []
+    seen = set()
+    for raw in matches.split(","):
+        key = raw.strip().strip("[]#\"'").lower()
+        if key.startswith("id:"):
+            key = key[3:].strip().strip("[]#\"'")
+        record = aliases.get(key)
+        if record and record["id"] not in seen:
+            seen.add(record["id"])
+            results.append(record)
+    return results
@@ -0,0 +1,117 @@
+"""In-memory prefix index for typeahead suggestions.
+
+Suggestions are built from approved item titles, categories and locations.
+Every word boundary of a phrase gets its own key in a sorted array, so
+"flask" finds "Red Hydro Flask Water Bottle" as well as "fla" does.
+Lookups are a bisect into that array plus a small top-k over the matches.
+"""
+
+import bisect
+import heapq
+import re
+import time
+
+from catalog import item_timestamp
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# How much each source contributes to a suggestion's frequency score
+KIND_WEIGHTS = {"title": 1.0, "category": 0.6, "location": 0.8}
+
+# Recency bonus decays with this half-life (in days)
+RECENCY_HALF_LIFE_DAYS = 14
+
+
+def normalize(text):
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over suggestion phrases."""
+
+    def __init__(self):
+        self._keys = []
+        self._phrase_ids = []
+        self._phrases = []
+        self.built_at = 0.0
+
+    def __len__(self):
+        return len(self._phrases)
+
+    @classmethod
+    def from_items(cls, items_data, extra_locations=()):
+        """Build an index from the raw `items` tree (id -> item dict)."""
+        stats = {}
+
+        def add(text, kind, ts, count=1):
+            key = normalize(text)
+            if not key:
+                return
+            entry = stats.get((key, kind))
+            if entry is None:
+                entry = stats[(key, kind)] = {"text": text.strip(), "kind": kind, "count": 0, "latest": 0.0}
+            entry["count"] += count
+            entry["latest"] = max(entry["latest"], ts)
+
+        for item in (items_data or {}).values():
+            if not isinstance(item, dict) or item.get("status") != "APPROVED":
+                continue
+            ts = item_timestamp(item)
+            add(item.get("title", ""), "title", ts)
+            add(item.get("category", ""), "category", ts)
+            add(item.get("location", ""), "location", ts)
+
+        # Known campus locations are suggestible even before anything is found there
+        for location in extra_locations:
+            add(location, "location", 0.0, count=0)
+
+        index = cls()
+        index._build(list(stats.values()))
+        return index
+
+    def _build(self, phrases):
+        pairs = []
+        for phrase_id, phrase in enumerate(phrases):
+            words = normalize(phrase["text"]).split()
+            for start in range(len(words)):
+                pairs.append((" ".join(words[start:]), phrase_id))
+        pairs.sort()
+        self._keys = [k for k, _ in pairs]
+        self._phrase_ids = [p for _, p in pairs]
+        self._phrases = phrases
+        self.built_at = time.time()
+
+    def _score(self, phrase, now):
+        weight = KIND_WEIGHTS.get(phrase["kind"], 1.0)
+        score = weight * (1 + phrase["count"])
+        if phrase["latest"]:
+            age_days = max(0.0, now - phrase["latest"]) / 86400
+            score += 2 * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        return score
+
+    def suggest(self, query, limit=8):
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + "\uffff", lo)
+        if lo == hi:
+            return []
+
+        now = time.time()
+        seen = {}
+        for pos in range(lo, hi):
+            phrase_id = self._phrase_ids[pos]
+            if phrase_id not in seen:
+                seen[phrase_id] = self._score(self._phrases[phrase_id], now)
+
+        top = heapq.nlargest(limit, seen.items(), key=lambda kv: kv[1])
+        return [
+            {
+                "text": self._phrases[pid]["text"],
+                "kind": self._phrases[pid]["kind"],
+                "count": self._phrases[pid]["count"],
+            }
+            for pid, _ in top
+        ]
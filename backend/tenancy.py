@@ -0,0 +1,110 @@
+"""Multi-campus partitioning.
+
+Each campus keeps its data under its own root in the database
+(campuses/<id>/items, ...; the original campus can stay at the top
+level) and gets its own in-memory state: item mirror, feed, search
+indexes, search prompt context, in-flight claim reviews and a cap on
+concurrent AI calls.
+Requests are routed by the X-Campus-Id header or the host's subdomain.
+"""
+
+import contextvars
+import threading
+
+import anyio
+
+from catalog import ItemStore
+from dedup import DuplicateIndex
+from feed import RecencyFeed
+from search_context import SearchContext
+from suggest import PrefixIndex
+
+_current = contextvars.ContextVar("campus", default=None)
+
+
+class UnknownCampus(Exception):
+    pass
+
+
+def data_root(campus_id, config):
+    """Database root a campus keeps its data under ("" for the top level)."""
+    return config.get("root", f"campuses/{campus_id}").strip("/")
+
+
+def join_path(root, path=""):
+    parts = [p for p in (root, (path or "").strip("/")) if p]
+    return "/".join(parts) or "/"
+
+
+class CampusState:
+    def __init__(self, campus_id, config, ai_concurrency, image_hashes=None):
+        self.id = campus_id
+        self.name = config.get("name", campus_id)
+        self.root = data_root(campus_id, config)
+        self.item_store = ItemStore()
+        self.recency_feed = RecencyFeed()
+        self.item_store.subscribe(self.recency_feed.on_item_changed)
+        self.search_context = SearchContext()
+        self.item_store.subscribe(self.search_context.on_item_changed)
+        self.suggest_index = PrefixIndex()
+        self.duplicate_index = DuplicateIndex(image_hashes)
+        self.item_store.subscribe(self.duplicate_index.on_item_changed)
+        self.claim_reviews_in_flight = {}
+        self.ai_slots = anyio.CapacityLimiter(ai_concurrency)
+        self.listener = None
+        self.listener_retry_at = 0.0
+        self.loaded_at = 0.0
+        self.lock = threading.Lock()
+
+    def path(self, path=""):
+        """Database path for this campus."""
+        return join_path(self.root, path)
+
+
+class CampusRegistry:
+    def __init__(self, campuses, default_id, ai_concurrency, image_hashes=None):
+        self.campuses = campuses
+        self.default_id = default_id
+        self.ai_concurrency = ai_concurrency
+        self.image_hashes = image_hashes
+        self._hosts = {}
+        for campus_id, config in campuses.items():
+            self._hosts[campus_id.lower()] = campus_id
+            for alias in config.get("subdomains", []):
+                self._hosts[alias.lower()] = campus_id
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, header=None, host=None):
+        """Campus ID for a request. An unknown header is an error; an unknown host falls back to the default."""
+        if header:
+            if header not in self.campuses:
+                raise UnknownCampus(header)
+            return header
+        subdomain = (host or "").split(":", 1)[0].split(".", 1)[0].lower()
+        return self._hosts.get(subdomain, self.default_id)
+
+    def get(self, campus_id):
+        state = self._states.get(campus_id)
+        if state is None:
+            with self._lock:
+                state = self._states.get(campus_id)
+                if state is None:
+                    state = CampusState(campus_id, self.campuses[campus_id], self.ai_concurrency, self.image_hashes)
+                    self._states[campus_id] = state
+        return state
+
+    def all(self):
+        return [self.get(campus_id) for campus_id in self.campuses]
+
+
+def activate(campus_id):
+    return _current.set(campus_id)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+def current_id(default):
+    return _current.get() or default
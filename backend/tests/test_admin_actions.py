@@ -0,0 +1,86 @@
+import admin_actions
+
+
+class FakeRef:
+    """Minimal stand-in for a firebase_admin db.Reference over a dict tree."""
+
+    def __init__(self, tree, path=""):
+        self.tree = tree
+        self.path = path
+        self.updates = []
+
+    def child(self, path):
+        return FakeRef(self.tree, f"{self.path}/{path}".strip("/"))
+
+    def get(self):
+        node = self.tree
+        for part in [p for p in self.path.split("/") if p]:
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def update(self, updates):
+        self.updates.append(updates)
+
+
+def make_tree():
+    return {
+        "items": {"item1": {"title": "Black Wallet", "location": "Gym", "owner": "admin1", "status": "APPROVED"}},
+        "claims": {"claim1": {"itemId": "item1", "itemTitle": "Black Wallet", "userId": "student1", "status": "PENDING"}},
+    }
+
+
+def test_approving_a_claim_archives_the_item():
+    root = FakeRef(make_tree())
+    results, _ = admin_actions.apply(
+        [{"op": "resolve_claim", "claim_id": "claim1", "status": "APPROVED"}], root
+    )
+    assert results[0]["ok"] and len(results[0]["pickupCode"]) == 6
+    updates = root.updates[0]
+    assert updates["items/item1"] is None
+    archived = updates["archive/items/item1"]
+    assert archived["status"] == "RESOLVED" and archived["claimId"] == "claim1"
+    assert updates["claims/claim1/status"] == "APPROVED"
+
+
+def test_second_claim_on_a_claimed_item_fails():
+    root = FakeRef(make_tree())
+    root.tree["claims"]["claim2"] = {"itemId": "item1", "userId": "student2"}
+    results, _ = admin_actions.apply([
+        {"op": "resolve_claim", "claim_id": "claim1", "status": "APPROVED"},
+        {"op": "resolve_claim", "claim_id": "claim2", "status": "APPROVED"},
+    ], root)
+    assert results[0]["ok"] and not results[1]["ok"]
+    assert "claims/claim2/status" not in root.updates[0]
+
+
+def test_students_claim_only_low_value_found_items():
+    tree = make_tree()
+    tree["items"]["item1"]["type"] = "FOUND"
+    tree["items"]["item2"] = {"title": "MacBook", "type": "FOUND", "status": "APPROVED", "highValue": True}
+    root = FakeRef(tree)
+    results, _ = admin_actions.apply([
+        {"op": "claim_item", "item_id": "item1", "user_id": "student1"},
+        {"op": "claim_item", "item_id": "item2", "user_id": "student1"},
+    ], root)
+    assert results[0]["ok"] and results[0]["pickupLocation"] == "Gym"
+    assert not results[1]["ok"]
+    updates = root.updates[0]
+    assert updates["archive/items/item1"]["claimedBy"] == "student1"
+    assert "items/item2" not in updates
+
+
+def test_set_item_status_can_flag_high_value():
+    root = FakeRef(make_tree())
+    admin_actions.apply([{"op": "set_item_status", "item_id": "item1", "status": "APPROVED", "high_value": True}], root)
+    assert root.updates[0]["items/item1/highValue"] is True
+
+
+def test_deleting_an_item_reports_its_image_for_release():
+    tree = make_tree()
+    tree["items"]["item1"]["imageUrl"] = "https://res.cloudinary.com/demo/lostfound/abc.jpg"
+    root = FakeRef(tree)
+    results, _ = admin_actions.apply([{"op": "delete_item", "item_id": "item1"}], root)
+    assert results[0]["imageUrl"] == "https://res.cloudinary.com/demo/lostfound/abc.jpg"
+    assert root.updates[0] == {"items/item1": None}
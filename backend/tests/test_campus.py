@@ -0,0 +1,55 @@
+from campus import location_match, parse_location
+
+
+def test_room_and_place_aliases():
+    assert parse_location("Room G100").room == "G100"
+    assert parse_location("lunch room").place == "cafeteria"
+    assert parse_location("aux gym").place == "aux_gym"
+    assert parse_location("somewhere") is None
+
+
+def test_exact_and_mismatched_locations_are_certain():
+    assert location_match("Gym", "the main gym") == (1.0, "same place", True)
+    score, _, certain = location_match("Gym", "Media Center")
+    assert score == 0.0 and certain
+
+
+def test_generic_or_multiple_places_are_not_certain():
+    score, _, certain = location_match("Gym", "after lunch in the gym")
+    assert score == 1.0 and not certain
+    _, _, certain = location_match("Bus Lot", "field trip bus")
+    assert not certain
+    _, _, certain = location_match("Front Office", "office")
+    assert not certain
+
+
+def test_prescore_never_rejects_uncertain_location():
+    import main
+
+    item = {"title": "Black Wallet", "description": "leather wallet", "location": "Gym"}
+    claim = {"claimedLocation": "after lunch", "claimedDescription": "my wallet"}
+    score, reason, certain = location_match(item["location"], claim["claimedLocation"])
+    assert main.prescore_claim(item, claim, score, reason, certain) is None
+    score, reason, certain = location_match(item["location"], "Media Center")
+    assert main.prescore_claim(item, claim, score, reason, certain)[0] is False
+
+
+def test_prescore_does_not_approve_on_public_listing_details():
+    import main
+    from seed_data import ITEMS
+
+    item = next(i for i in ITEMS if "MacBook" in i["title"])
+    claim = {
+        "claimedLocation": "Room F105",
+        "claimedDescription": "silver macbook pro with clear case",
+        "additionalProof": "it's mine",
+    }
+    score, reason, certain = location_match(item["location"], claim["claimedLocation"])
+    assert score == 1.0 and certain
+    assert main.prescore_claim(item, claim, score, reason, certain) is None
+
+    claim["additionalProof"] = "silver macbook pro, clear case, room f105"
+    assert main.prescore_claim(item, claim, score, reason, certain) is None
+
+    claim["proofImageUrls"] = ["https://example.com/receipt.jpg"]
+    assert main.prescore_claim(item, claim, score, reason, certain)[0] is True
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+ITEM = {"title": "Black Wallet", "category": "Personal Items", "location": "Gym", "description": "leather bifold"}
+CLAIM = {"claimedLocation": "after lunch", "claimedDescription": "black leather wallet", "additionalProof": ""}
+
+
+@pytest.fixture
+def claim_db(monkeypatch):
+    """Claim and item records behind main.fetch/main.ref, plus a counting fake model."""
+    claims = {"claim1": dict(CLAIM)}
+    calls = []
+
+    class ClaimRef:
+        def __init__(self, path):
+            self.claim_id = path.split("/")[-1]
+
+        def get(self):
+            return claims.get(self.claim_id)
+
+        def update(self, data):
+            claims[self.claim_id].update(data)
+
+    def chat_completion(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(
+            content="APPROVED: true\nCONFIDENCE: 90\nREASON: Details match."))])
+
+    monkeypatch.setattr(main, "fetch", lambda path: dict(ITEM) if path == "items/item1" else None)
+    monkeypatch.setattr(main, "ref", ClaimRef)
+    monkeypatch.setattr(main, "chat_completion", chat_completion)
+    return SimpleNamespace(claims=claims, calls=calls)
+
+
+def test_unchanged_claim_reuses_stored_review(claim_db):
+    first = main.review_claim("item1", "claim1")
+    assert first["approved"] and first["cached"] is False
+    assert claim_db.claims["claim1"]["aiReview"]["inputHash"] == main.claim_review_hash(ITEM, CLAIM)
+
+    again = main.review_claim("item1", "claim1")
+    assert again["cached"] is True and len(claim_db.calls) == 1
+
+    claim_db.claims["claim1"]["additionalProof"] = "initials JM inside"
+    assert main.review_claim("item1", "claim1")["cached"] is False
+    assert len(claim_db.calls) == 2
+
+
+def test_force_reruns_the_review(claim_db):
+    main.review_claim("item1", "claim1")
+    forced = main.review_claim("item1", "claim1", force=True)
+    assert forced["cached"] is False and len(claim_db.calls) == 2
+
+
+@pytest.fixture
+def slow_review(monkeypatch):
+    monkeypatch.setattr(main, "AI_ENABLED", True)
+    monkeypatch.setattr(main, "openai_client", object())
+    started = threading.Event()
+    runs = []
+
+    def review_claim(item_id, claim_id, force=False):
+        runs.append(claim_id)
+        started.set()
+        time.sleep(0.2)
+        return {"approved": True, "reason": "ok", "confidence": 90, "needsAdminReview": False, "cached": False}
+
+    monkeypatch.setattr(main, "review_claim", review_claim)
+    return SimpleNamespace(runs=runs, started=started)
+
+
+def test_concurrent_calls_share_one_evaluation(slow_review):
+    request = main.ClaimReviewRequest(item_id="item1", claim_id="claim1")
+
+    async def run():
+        return await asyncio.gather(main.ai_review_claim(request), main.ai_review_claim(request))
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert slow_review.runs == ["claim1"]
+    assert not main.campus().claim_reviews_in_flight
+
+
+def test_waiter_takes_over_when_the_first_call_is_cancelled(slow_review):
+    request = main.ClaimReviewRequest(item_id="item1", claim_id="claim1")
+
+    async def run():
+        leader = asyncio.create_task(main.ai_review_claim(request))
+        await asyncio.to_thread(slow_review.started.wait)
+        waiter = asyncio.create_task(main.ai_review_claim(request))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.wait_for(waiter, timeout=2)
+
+    assert asyncio.run(run())["approved"] is True
+    assert len(slow_review.runs) == 2
+    assert not main.campus().claim_reviews_in_flight
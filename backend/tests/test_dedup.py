@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from catalog import ItemStore
+from dedup import DuplicateIndex, dhash, hamming
+
+WALLET = {
+    "title": "Black leather wallet",
+    "description": "Bifold wallet with a student ID card and a library card inside",
+    "type": "FOUND",
+    "status": "APPROVED",
+}
+
+
+def test_reworded_listing_is_found_through_lsh():
+    index = DuplicateIndex.from_items({"w1": WALLET})
+    matches = index.find("Lost black leather wallet", "bifold, has my student ID card", "FOUND")
+    assert [m["id"] for m in matches] == ["w1"]
+    assert index.find("Blue water bottle", "Hydro flask with stickers", "FOUND") == []
+
+
+def test_other_type_and_excluded_ids_are_skipped():
+    index = DuplicateIndex.from_items({"w1": WALLET})
+    args = ("Black leather wallet", WALLET["description"])
+    assert index.find(*args, item_type="LOST") == []
+    assert index.find(*args, exclude="w1") == []
+
+
+def test_image_hash_cutoff():
+    index = DuplicateIndex.from_items({"w1": {**WALLET, "title": "Wallet", "description": "", "imageHash": "00ff00ff00ff00ff"}})
+    base = 0x00FF00FF00FF00FF
+    close = base ^ 0b111111            # 6 bits differ
+    far = base ^ 0b1111111             # 7 bits differ
+    assert [m["imageDistance"] for m in index.find("", "", image_hash=close, image_distance=6)] == [6]
+    assert hamming(base, far) == 7
+    assert index.find("", "", image_hash=far, image_distance=6) == []
+
+
+def test_index_follows_item_store_changes():
+    store = ItemStore()
+    index = DuplicateIndex()
+    store.subscribe(index.on_item_changed)
+    store.load({"w1": WALLET})
+    assert "w1" in index.entries
+
+    store.load({"w1": {**WALLET, "status": "REJECTED"}})
+    assert len(index) == 0
+    assert index.find("Black leather wallet", WALLET["description"]) == []
+
+
+def test_dhash_is_stable_under_resizing():
+    Image = pytest.importorskip("PIL.Image")
+
+    def png(size):
+        img = Image.new("L", size)
+        img.putdata([(x * 255) // size[0] for y in range(size[1]) for x in range(size[0])])
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    assert hamming(dhash(png((90, 80))), dhash(png((180, 160)))) <= 2
+    assert dhash(b"not an image") is None
@@ -0,0 +1,81 @@
+import json
+
+import export
+
+
+ITEMS = {
+    "item1": {"title": "MacBook", "highValue": True},
+    "item2": {"title": "Pencil", "highValue": False},
+    "item3": {"title": "Hoodie"},
+}
+
+
+def test_high_value_filter_excludes_items_without_the_flag():
+    keep = export.make_filter(high_value=True)
+    assert [k for k, r in ITEMS.items() if keep(r)] == ["item1"]
+    keep = export.make_filter(high_value=False)
+    assert [k for k, r in ITEMS.items() if keep(r)] == ["item2"]
+
+
+def test_claims_filter_on_their_item():
+    claims = {
+        "c1": {"itemId": "item1"},
+        "c2": {"itemId": "item2"},
+        "c3": {"itemId": "gone"},
+    }
+    lookups = []
+
+    def lookup(item_ids):
+        lookups.append(item_ids)
+        return {i: ITEMS[i].get("highValue") for i in item_ids if i in ITEMS}
+
+    high_value_of = export.LinkedHighValue(lookup)
+    high_value_of.load(list(claims.items()))
+    keep = export.make_filter(high_value=True, high_value_of=high_value_of)
+    assert [k for k, r in claims.items() if keep(r)] == ["c1"]
+    assert lookups == [{"item1", "item2", "gone"}]
+
+
+class FakePagedRef:
+    def __init__(self, records):
+        self.records = records
+        self.start = None
+        self.limit = None
+
+    def order_by_key(self):
+        return self
+
+    def start_at(self, key):
+        self.start = key
+        return self
+
+    def limit_to_first(self, limit):
+        self.limit = limit
+        return self
+
+    def get(self):
+        keys = sorted(k for k in self.records if self.start is None or k >= self.start)[:self.limit]
+        self.start = None
+        return {k: self.records[k] for k in keys}
+
+
+def test_linked_flags_are_looked_up_one_page_at_a_time():
+    claims = {f"c{i}": {"itemId": "item1" if i % 2 else "item2"} for i in range(5)}
+    lookups = []
+
+    def lookup(item_ids):
+        lookups.append(item_ids)
+        return {i: ITEMS[i].get("highValue") for i in item_ids}
+
+    high_value_of = export.LinkedHighValue(lookup)
+    keep = export.make_filter(high_value=True, high_value_of=high_value_of)
+    chunks = export.export_stream(FakePagedRef(claims), "claims", "ndjson", keep, page_size=2, on_page=high_value_of.load)
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["c1", "c3"]
+    assert len(lookups) == 3
+
+
+def test_csv_flattens_nested_columns():
+    records = [("c1", {"itemId": "item1", "aiReview": {"approved": True, "confidence": 90}})]
+    text = "".join(export.stream_csv(records, ["id", "itemId", "aiReview.approved", "aiReview.confidence"]))
+    assert text.splitlines() == ["id,itemId,aiReview.approved,aiReview.confidence", "c1,item1,True,90"]
@@ -0,0 +1,48 @@
+from feed import RecencyFeed
+
+
+def item(created_at, status="APPROVED", category="Electronics", type_="FOUND"):
+    return {"createdAt": created_at, "status": status, "category": category, "type": type_}
+
+
+def test_newest_items_come_first():
+    feed = RecencyFeed()
+    feed.on_item_changed("old", None, item("2025-01-01T08:00:00"))
+    feed.on_item_changed("new", None, item("2025-03-01T08:00:00"))
+    feed.on_item_changed("mid", None, item("2025-02-01T08:00:00"))
+    assert feed.latest(10) == ["new", "mid", "old"]
+    assert feed.latest(2) == ["new", "mid"]
+
+
+def test_unapproving_removes_an_item():
+    feed = RecencyFeed()
+    approved = item("2025-01-01T08:00:00")
+    feed.on_item_changed("a", None, approved)
+    feed.on_item_changed("a", approved, {**approved, "status": "PENDING"})
+    assert feed.latest(10) == [] and len(feed) == 0
+    assert feed.latest(10, category="Electronics") == []
+
+    feed.on_item_changed("a", None, approved)
+    feed.on_item_changed("a", approved, None)
+    assert feed.latest(10) == []
+
+
+def test_category_and_type_filters():
+    feed = RecencyFeed()
+    feed.on_item_changed("phone", None, item("2025-01-03T08:00:00", category="Electronics", type_="FOUND"))
+    feed.on_item_changed("laptop", None, item("2025-01-02T08:00:00", category="Electronics", type_="LOST"))
+    feed.on_item_changed("hoodie", None, item("2025-01-04T08:00:00", category="Clothing", type_="FOUND"))
+
+    assert feed.latest(10, category="Electronics") == ["phone", "laptop"]
+    assert feed.latest(10, item_type="FOUND") == ["hoodie", "phone"]
+    assert feed.latest(10, category="Electronics", item_type="LOST") == ["laptop"]
+    assert feed.latest(10, category="Books") == []
+
+
+def test_recategorised_item_moves_bucket():
+    feed = RecencyFeed()
+    old = item("2025-01-01T08:00:00", category="Other")
+    feed.on_item_changed("a", None, old)
+    feed.on_item_changed("a", old, {**old, "category": "Clothing"})
+    assert feed.latest(10, category="Other") == []
+    assert feed.latest(10, category="Clothing") == ["a"]
@@ -0,0 +1,210 @@
+from fastapi.testclient import TestClient
+
+import main
+
+
+client = TestClient(main.app)
+
+
+def test_app_imports_and_serves_health():
+    response = client.get("/api/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_ai_status():
+    response = client.get("/api/ai-status")
+    assert response.status_code == 200
+
+
+def test_check_duplicate_rejects_bad_image_hash():
+    response = client.post("/api/check-duplicate", json={"title": "Wallet", "image_hash": "not-hex"})
+    assert response.status_code == 400
+
+
+def test_check_duplicate_accepts_upload_hash():
+    response = client.post("/api/check-duplicate", json={"title": "Wallet", "image_hash": "00ff00ff00ff00ff"})
+    assert response.status_code == 200
+    assert response.json()["duplicate"] is False
+
+
+def test_flagging_a_listing_requires_its_owner(monkeypatch):
+    monkeypatch.setattr(main.auth, "verify_id_token", lambda token: {"uid": token})
+    items = {"items/item1": {"title": "Black wallet", "owner": "student1", "status": "PENDING"}}
+    monkeypatch.setattr(main, "fetch", lambda path: items.get(path))
+    updates = []
+
+    class FakeRef:
+        def __init__(self, path):
+            self.path = path
+
+        def update(self, data):
+            updates.append((self.path, data))
+
+    monkeypatch.setattr(main, "ref", FakeRef)
+    body = {"title": "Black wallet", "image_hash": "00ff00ff00ff00ff"}
+
+    assert client.post("/api/check-duplicate", json={**body, "item_id": "item1"}).status_code == 401
+    response = client.post("/api/check-duplicate", json={**body, "item_id": "nope"},
+                           headers={"Authorization": "Bearer student1"})
+    assert response.status_code == 404
+    response = client.post("/api/check-duplicate", json={**body, "item_id": "item1"},
+                           headers={"Authorization": "Bearer student2"})
+    assert response.status_code == 403
+    assert updates == []
+
+    response = client.post("/api/check-duplicate", json={**body, "item_id": "item1"},
+                           headers={"Authorization": "Bearer student1"})
+    assert response.status_code == 200
+    assert updates == [("items/item1", {"possibleDuplicateOf": None, "imageHash": "00ff00ff00ff00ff"})]
+    assert "item1" in main.campus().duplicate_index.entries
+    main.campus().duplicate_index.remove("item1")
+
+
+def test_admin_routes_require_a_token():
+    assert client.get("/api/admin/slow-requests").status_code == 401
+    assert client.post("/api/admin/actions", json={"operations": []}).status_code == 401
+    response = client.get("/api/admin/export/items", headers={"Authorization": "Bearer bad"})
+    assert response.status_code == 401
+
+
+def test_admin_routes_require_the_admin_role(monkeypatch):
+    monkeypatch.setattr(main.auth, "verify_id_token", lambda token: {"uid": token})
+    roles = {"users/admin1/role": "ADMIN", "users/student1/role": "USER"}
+    monkeypatch.setattr(main, "fetch", lambda path: roles.get(path))
+
+    response = client.get("/api/admin/slow-requests", headers={"Authorization": "Bearer student1"})
+    assert response.status_code == 403
+    response = client.get("/api/admin/slow-requests", headers={"Authorization": "Bearer admin1"})
+    assert response.status_code == 200
+
+
+def test_admin_actions_apply_valid_operations_in_one_update(monkeypatch):
+    monkeypatch.setattr(main.auth, "verify_id_token", lambda token: {"uid": token})
+    monkeypatch.setattr(main, "fetch", lambda path: "ADMIN" if path == "users/admin1/role" else None)
+    tree = {"items": {"item1": {"title": "Black Wallet", "owner": "student1", "status": "PENDING"}}}
+    updates = []
+
+    class FakeRef:
+        def __init__(self, path=""):
+            self.path = path
+
+        def child(self, path):
+            return FakeRef(f"{self.path}/{path}".strip("/"))
+
+        def get(self):
+            node = tree
+            for part in [p for p in self.path.split("/") if p]:
+                node = node.get(part) if isinstance(node, dict) else None
+            return node
+
+        def update(self, data):
+            updates.append(data)
+
+    monkeypatch.setattr(main, "ref", FakeRef)
+    operations = [
+        {"op": "set_item_status", "item_id": "item1", "status": "APPROVED"},
+        {"op": "set_item_status", "item_id": "missing", "status": "APPROVED"},
+        {"op": "reply_inquiry", "inquiry_id": "inq1", "message": "hi"},
+    ]
+    response = client.post("/api/admin/actions", json={"operations": operations},
+                           headers={"Authorization": "Bearer admin1"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["ok"] for r in body["results"]] == [True, False, False]
+    assert body["results"][1]["error"] == "Item not found"
+    assert len(updates) == 1
+    assert updates[0]["items/item1/status"] == "APPROVED"
+    assert body["applied"] and body["writes"] == len(updates[0])
+
+
+def test_deleting_an_item_releases_its_upload(monkeypatch):
+    monkeypatch.setattr(main.auth, "verify_id_token", lambda token: {"uid": token})
+    monkeypatch.setattr(main, "fetch", lambda path: "ADMIN" if path == "users/admin1/role" else None)
+    monkeypatch.setattr(main, "ref", lambda path="": None)
+    url = "https://res.cloudinary.com/demo/lostfound/abc.jpg"
+    monkeypatch.setattr(main.admin_actions, "apply", lambda operations, root: (
+        [{"index": 0, "op": "delete_item", "ok": True, "imageUrl": url}], 1
+    ))
+    monkeypatch.setattr(main.upload_index, "public_id_for", lambda u: "lostfound/abc" if u == url else None)
+    released = []
+    monkeypatch.setattr(main, "release_upload", released.append)
+
+    response = client.post("/api/admin/actions", json={"operations": [{"op": "delete_item", "item_id": "item1"}]},
+                           headers={"Authorization": "Bearer admin1"})
+    assert response.status_code == 200
+    assert released == ["lostfound/abc"]
+
+
+def test_item_claim_requires_sign_in():
+    assert client.post("/api/items/item1/claim").status_code == 401
+
+
+def test_item_store_refreshes_without_a_listener(monkeypatch):
+    monkeypatch.setattr(main, "ITEM_LISTENER_ENABLED", False)
+    monkeypatch.setattr(main, "ITEM_STORE_REFRESH_SECONDS", 30)
+    state = main.campus()
+    monkeypatch.setattr(state, "loaded_at", 0.0)
+    items = {"item1": {"title": "Wallet", "status": "APPROVED"}}
+    monkeypatch.setattr(main, "fetch", lambda path: dict(items))
+
+    assert main.get_item_store().get("item1")["title"] == "Wallet"
+    items["item2"] = {"title": "Keys", "status": "APPROVED"}
+    assert main.get_item_store().get("item2") is None   # still fresh
+
+    state.loaded_at -= 31
+    assert main.get_item_store().get("item2")["title"] == "Keys"
+
+
+
+def test_blocking_work_runs_in_the_threadpool():
+    import inspect
+
+    # Firebase calls block, so these endpoints must not run on the event loop
+    for endpoint in (main.upload_image, main.value_override):
+        assert not inspect.iscoroutinefunction(endpoint), endpoint.__name__
+    # AI endpoints wait for a campus slot on the loop, then hand blocking work to the threadpool
+    for handler in (main.review_content, main.review_image, main.estimate_value, main.search_items,
+                    main.describe_item, main.review_claim):
+        assert not inspect.iscoroutinefunction(handler), handler.__name__
+
+
+def test_ai_calls_wait_for_a_campus_slot_without_a_thread(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(main, "AI_QUOTA_WAIT_SECONDS", 0.1)
+    state = main.campus()
+    monkeypatch.setattr(state, "ai_slots", main.anyio.CapacityLimiter(1))
+
+    def handler():
+        try:
+            main.chat_completion(model="x", messages=[])
+        except RuntimeError:
+            return "fallback"
+        return "ai"
+
+    completions = SimpleNamespace(create=lambda **kwargs: "ok")
+    monkeypatch.setattr(main, "openai_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+    async def run():
+        assert await main.run_with_ai_slot(handler) == "ai"
+        borrower = object()
+        await state.ai_slots.acquire_on_behalf_of(borrower)
+        try:
+            return await main.run_with_ai_slot(handler)   # quota taken: waits, then falls back
+        finally:
+            state.ai_slots.release_on_behalf_of(borrower)
+
+    assert asyncio.run(run()) == "fallback"
+    assert state.ai_slots.borrowed_tokens == 0
+    assert handler() == "fallback"                        # called outside run_with_ai_slot
+
+
+def test_campus_header_reaches_threadpool_endpoints(monkeypatch):
+    monkeypatch.setitem(main.campuses.campuses, "wshs", {"name": "Weddington High School"})
+    assert client.get("/api/campus", headers={"X-Campus-Id": "wshs"}).json()["id"] == "wshs"
+    assert client.get("/api/campus").json()["id"] == main.DEFAULT_CAMPUS
+    assert client.get("/api/campus", headers={"X-Campus-Id": "nope"}).status_code == 404
+    assert main.campuses.get("wshs").path("items") == "campuses/wshs/items"
@@ -0,0 +1,42 @@
+import pytest
+
+from prescreen import prescreen
+
+
+@pytest.mark.parametrize("title, description", [
+    ("Bullet journal", "Dotted bullet journal with a black cover"),
+    ("Hot glue gun", "Left in the art room"),
+    ("Lighter blue denim jacket", "Size M, found in the gym"),
+    ("TI-84 calculator", "Graphing calculator, serial 1234567890"),
+    ("1 Gray Flash Drive", "found in library"),
+    ("32 Gig Flash Drive", "black"),
+    ("Nike cleats", "left at 2 Tennis Court after practice"),
+])
+def test_harmless_lookalikes_are_not_rejected(title, description):
+    verdict = prescreen(title, description)
+    assert verdict is None or verdict["approved"]
+
+
+@pytest.mark.parametrize("title, description", [
+    ("Found a phone", "Jake Miller left his phone here, he is a loser and everyone hates him"),
+    ("Keys", "buy cheap followers dm me"),
+    ("Water bottle", "Found a bottle near 704 555 1234"),
+])
+def test_text_outside_item_vocabulary_goes_to_the_model(title, description):
+    assert prescreen(title, description) is None
+
+
+def test_plain_report_is_approved_locally():
+    verdict = prescreen("Black Leather Wallet", "Bifold wallet found near the cafeteria during 3rd period")
+    assert verdict == {"approved": True, "reason": "Content approved"}
+
+
+@pytest.mark.parametrize("title, description", [
+    ("Lost AirPods", "Call me at 704-555-1234"),
+    ("Lost AirPods", "my email is someone@example.com"),
+    ("Lost AirPods", "bring them to my house at 12 Maple Street"),
+    ("Vape pen", "found in the bathroom"),
+    ("Jacket", "this is fucking ugly"),
+])
+def test_clear_violations_are_rejected(title, description):
+    assert prescreen(title, description)["approved"] is False
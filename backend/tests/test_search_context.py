@@ -0,0 +1,60 @@
+from search_context import SearchContext, estimate_tokens, resolve_aliases
+
+
+def approved(title, category="Electronics", location="Gym", created_at="2025-01-01T08:00:00"):
+    return {"title": title, "category": category, "location": location, "status": "APPROVED",
+            "description": "", "createdAt": created_at}
+
+
+def context_of(items):
+    context = SearchContext()
+    for item_id, item in items.items():
+        context.on_item_changed(item_id, None, item)
+    return context
+
+
+def test_pack_stays_within_the_token_budget():
+    context = context_of({f"i{n}": approved(f"Black Phone Case {n}") for n in range(40)})
+    text, aliases = context.pack("phone", token_budget=50)
+    assert 0 < len(aliases) < 40
+    assert sum(estimate_tokens(line) for line in text.splitlines()) <= 50
+    assert len(text.splitlines()) == len(aliases)
+
+
+def test_pack_skips_a_line_too_long_for_the_rest_of_the_budget():
+    context = context_of({
+        "long": approved("Phone " + "with a very long title " * 6, created_at="2025-02-01T08:00:00"),
+        "short": approved("Phone"),
+    })
+    text, aliases = context.pack("phone", token_budget=12)
+    assert [r["id"] for r in aliases.values()] == ["short"]
+    assert "very long" not in text
+
+
+def test_pack_ranks_best_match_first_and_respects_max_items():
+    context = context_of({
+        "wallet": approved("Leather Wallet", category="Personal Items"),
+        "airpods": approved("White AirPods"),
+        "case": approved("AirPods Case"),
+    })
+    _, aliases = context.pack("airpods", token_budget=500, max_items=2)
+    assert sorted(r["id"] for r in aliases.values()) == ["airpods", "case"]
+    assert list(aliases) == ["1", "2"]
+
+
+def test_unapproved_items_leave_the_context():
+    context = context_of({"a": approved("Phone")})
+    context.on_item_changed("a", approved("Phone"), {**approved("Phone"), "status": "REJECTED"})
+    assert len(context) == 0 and context.pack("phone", 100) == ("", {})
+
+
+def test_resolve_aliases_accepts_model_formatting():
+    aliases = {"1": {"id": "i1"}, "2": {"id": "i2"}, "a": {"id": "i3"}}
+    assert [r["id"] for r in resolve_aliases("ID: 1, [2], ID:[A]", aliases)] == ["i1", "i2", "i3"]
+    assert [r["id"] for r in resolve_aliases('"1", #2', aliases)] == ["i1", "i2"]
+
+
+def test_resolve_aliases_ignores_unknown_and_repeated_aliases():
+    aliases = {"1": {"id": "i1"}}
+    assert [r["id"] for r in resolve_aliases("1, 9, zz, 1, -NxYlongpushid", aliases)] == ["i1"]
+    assert resolve_aliases("", aliases) == []
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from suggest import PrefixIndex
+
+
+def approved(title, category="Other", location="Gym", days_ago=0):
+    created = (datetime.now() - timedelta(days=days_ago)).isoformat()
+    return {"title": title, "category": category, "location": location, "status": "APPROVED", "createdAt": created}
+
+
+def texts(index, query):
+    return [s["text"] for s in index.suggest(query)]
+
+
+def test_matches_start_of_any_word_only():
+    index = PrefixIndex.from_items({"i1": approved("Red Hydro Flask Water Bottle")})
+    assert "Red Hydro Flask Water Bottle" in texts(index, "fla")
+    assert "Red Hydro Flask Water Bottle" in texts(index, "water bot")
+    assert texts(index, "lask") == []           # not a word boundary
+    assert texts(index, "   ") == []
+
+
+def test_unapproved_items_are_not_suggested():
+    index = PrefixIndex.from_items({"i1": {**approved("Secret Diary"), "status": "PENDING"}})
+    assert texts(index, "sec") == []
+
+
+def test_frequent_phrases_rank_first():
+    items = {f"b{i}": approved("Black Backpack", location="Library", days_ago=30) for i in range(3)}
+    items["w"] = approved("Blue Binder", location="Library", days_ago=30)
+    index = PrefixIndex.from_items(items)
+    assert texts(index, "b")[:2] == ["Black Backpack", "Blue Binder"]
+
+
+def test_recent_phrases_break_ties():
+    index = PrefixIndex.from_items({
+        "old": approved("Gray Scarf", days_ago=60),
+        "new": approved("Gray Sweater", days_ago=0),
+    })
+    assert texts(index, "gray s") == ["Gray Sweater", "Gray Scarf"]
+
+
+def test_known_locations_are_suggested_before_any_item():
+    index = PrefixIndex.from_items({}, ["Media Center"])
+    assert index.suggest("cen") == [{"text": "Media Center", "kind": "location", "count": 0}]
@@ -0,0 +1,39 @@
+import threading
+import time
+
+import tracing
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_request_stacks_only_hold_the_requests_own_threads():
+    profiler = tracing.Profiler(interval_ms=1)
+    trace, token = tracing.start("GET", "/slow")
+    profiler.begin(trace)
+
+    stop = threading.Event()
+
+    def other_request():
+        while not stop.is_set():
+            busy(0.001)
+
+    other = threading.Thread(target=other_request)
+    other.start()
+    try:
+        with tracing.span("work"):
+            busy(0.2)
+    finally:
+        stop.set()
+        other.join()
+        tracing.finish(token)
+    profiler.end(trace, 1000, threshold_ms=0)
+
+    snapshot = profiler.snapshots[-1]
+    assert snapshot["scope"] == "process"
+    assert any("other_request" in s["stack"] for s in snapshot["stacks"])
+    assert snapshot["request_samples"] > 0
+    assert not any("other_request" in s["stack"] for s in snapshot["request_stacks"])
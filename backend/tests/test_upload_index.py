@@ -0,0 +1,28 @@
+from upload_index import UploadIndex
+
+
+def test_shared_asset_is_released_only_by_its_last_user(tmp_path):
+    path = tmp_path / "upload_index.json"
+    index = UploadIndex(str(path))
+    index.put("digest1", "lostfound/abc", "https://example.com/abc.jpg", "00ff")
+
+    assert index.acquire("digest1")["public_id"] == "lostfound/abc"
+    assert index.acquire("missing") is None
+
+    assert index.release("lostfound/abc") == 1
+    assert UploadIndex(str(path)).get("digest1")["refs"] == 1
+    assert index.release("lostfound/abc") == 0
+    assert index.get("digest1") is None
+
+
+def test_entries_without_a_count_hold_one_reference(tmp_path):
+    path = tmp_path / "upload_index.json"
+    path.write_text('{"d": {"public_id": "p", "url": "u", "imageHash": null}}')
+    assert UploadIndex(str(path)).release("p") == 0
+
+
+def test_public_id_is_found_by_url(tmp_path):
+    index = UploadIndex(str(tmp_path / "upload_index.json"))
+    index.put("digest1", "lostfound/abc", "https://example.com/abc.jpg")
+    assert index.public_id_for("https://example.com/abc.jpg") == "lostfound/abc"
+    assert index.public_id_for("https://images.unsplash.com/photo-1") is None
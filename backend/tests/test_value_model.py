@@ -0,0 +1,39 @@
+import pytest
+
+from ai_config import VALUE_CONFIDENCE_THRESHOLD
+from value_model import ValueClassifier
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    model = ValueClassifier()
+    model.fit()
+    return model
+
+
+@pytest.mark.parametrize("title", ["Apple Pencil", "Hydro Flask water bottle", "iPhone charger cable"])
+def test_mixed_signals_escalate(classifier, title):
+    _, confidence, reason = classifier.predict(title)
+    assert confidence < VALUE_CONFIDENCE_THRESHOLD
+    assert reason.startswith("Mixed value signals")
+
+
+def test_seed_labels_agree_with_prompt_policy(classifier):
+    assert classifier.predict("TI-84 Plus graphing calculator")[0] is True
+    assert classifier.predict("Prescription glasses")[0] is True
+
+
+def test_clear_items_are_still_decided_locally(classifier):
+    high_value, confidence, _ = classifier.predict("MacBook Pro laptop")
+    assert high_value and confidence >= VALUE_CONFIDENCE_THRESHOLD
+    high_value, confidence, _ = classifier.predict("Spiral notebook")
+    assert not high_value and confidence >= VALUE_CONFIDENCE_THRESHOLD
+
+
+def test_override_retrains():
+    model = ValueClassifier()
+    model.fit()
+    for _ in range(3):
+        model.add_override("Gray hoodie", "", "Clothing", True, refit=False)
+    model.fit()
+    assert model.predict("Gray hoodie", "", "Clothing")[0] is True
@@ -0,0 +1,144 @@
+"""Per-request span timing and sampled slow-request profiling.
+
+`span(name)` times a block into the current request's trace; the HTTP
+middleware in main.py turns the trace into a Server-Timing header. When
+profiling is on, a sampler thread walks the stacks of every thread while
+profiled requests are in flight, and the collapsed stacks of requests
+that turn out slow are kept in a fixed-size ring buffer.
+
+Process-wide stacks include whatever else was running at the time. Only
+samples from a thread that was inside one of the request's own spans are
+attributed to the request itself ("request_stacks").
+"""
+
+import contextvars
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar("trace", default=None)
+
+
+class Trace:
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.spans = {}
+        self.samples = None
+        self.own_samples = None
+        self.peak_concurrency = 1
+        self.threads = {}  # thread ident -> open span depth
+
+    def add(self, name, ms):
+        self.spans[name] = self.spans.get(name, 0.0) + ms
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self, total_ms):
+        parts = [f"{name};dur={ms:.1f}" for name, ms in self.spans.items()]
+        parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+
+def start(method, path):
+    trace = Trace(method, path)
+    return trace, _current.set(trace)
+
+
+def finish(token):
+    _current.reset(token)
+
+
+@contextmanager
+def span(name):
+    """Time a block into the current request's trace (no-op outside a request)."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    ident = threading.get_ident()
+    trace.threads[ident] = trace.threads.get(ident, 0) + 1
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, (time.perf_counter() - t0) * 1000)
+        depth = trace.threads.get(ident, 1) - 1
+        if depth:
+            trace.threads[ident] = depth
+        else:
+            trace.threads.pop(ident, None)
+
+
+# Innermost frames in these files are idle threads, not work
+_IDLE_FILES = {"threading.py", "selectors.py", "queue.py"}
+
+
+class Profiler:
+    """Samples all thread stacks while profiled requests run; keeps slow ones."""
+
+    def __init__(self, interval_ms=5, ring_size=50, max_depth=30):
+        self.interval = interval_ms / 1000
+        self.max_depth = max_depth
+        self.snapshots = deque(maxlen=ring_size)
+        self._active = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def begin(self, trace):
+        trace.samples = Counter()
+        trace.own_samples = Counter()
+        with self._lock:
+            self._active.add(trace)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def end(self, trace, total_ms, threshold_ms):
+        with self._lock:
+            self._active.discard(trace)
+        if total_ms >= threshold_ms:
+            self.snapshots.append({
+                "method": trace.method,
+                "path": trace.path,
+                "at": time.time(),
+                "duration_ms": round(total_ms, 1),
+                "spans": {k: round(v, 1) for k, v in trace.spans.items()},
+                "scope": "process",
+                "concurrent_requests": trace.peak_concurrency - 1,
+                "samples": sum(trace.samples.values()),
+                "stacks": [{"stack": s, "count": c} for s, c in trace.samples.most_common(25)],
+                "request_samples": sum(trace.own_samples.values()),
+                "request_stacks": [{"stack": s, "count": c} for s, c in trace.own_samples.most_common(25)],
+            })
+
+    def _collapse(self, frame):
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _run(self):
+        own = threading.get_ident()
+        while True:
+            with self._lock:
+                active = list(self._active)
+                if not active:
+                    self._thread = None
+                    return
+            stacks = {
+                ident: self._collapse(frame)
+                for ident, frame in sys._current_frames().items()
+                if ident != own and frame.f_code.co_filename.rsplit("/", 1)[-1] not in _IDLE_FILES
+            }
+            for trace in active:
+                trace.peak_concurrency = max(trace.peak_concurrency, len(active))
+                trace.samples.update(stacks.values())
+                trace.own_samples.update(stack for ident, stack in stacks.items() if ident in trace.threads)
+            time.sleep(self.interval)
@@ -0,0 +1,98 @@
+"""Content-hash index of images already uploaded to Cloudinary.
+
+Maps the SHA-256 of the decoded image bytes to the asset it was
+uploaded as, so identical re-uploads (retries, double-clicks, the same
+proof photo twice) reuse the existing URL. Each entry counts the uploads
+sharing it, so deleting the asset for one listing does not break the
+image on another. The index is a small JSON file rewritten atomically on
+every change.
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+
+class UploadIndex:
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, ValueError) as e:
+            print(f"Upload index unreadable, starting empty: {e}")
+            self._entries = {}
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".upload_index.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Upload index save error: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, digest):
+        return self._entries.get(digest)
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries.values())
+
+    def public_id_for(self, url):
+        """Asset an uploaded URL belongs to, or None for images this index did not upload."""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.get("url") == url:
+                    return entry.get("public_id")
+        return None
+
+    def acquire(self, digest):
+        """Reuse an existing asset: count one more reference and return its entry, or None."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            entry["refs"] = entry.get("refs", 1) + 1
+            self._save()
+            return dict(entry)
+
+    def put(self, digest, public_id, url, image_hash=None):
+        with self._lock:
+            self._entries[digest] = {"public_id": public_id, "url": url, "imageHash": image_hash, "refs": 1}
+            self._save()
+
+    def release(self, public_id):
+        """Drop one reference to an asset.
+
+        Returns the references left; 0 means the asset is unused (or was
+        never indexed) and can be deleted.
+        """
+        with self._lock:
+            remaining = 0
+            for digest, entry in list(self._entries.items()):
+                if entry.get("public_id") != public_id:
+                    continue
+                entry["refs"] = entry.get("refs", 1) - 1
+                if entry["refs"] <= 0:
+                    del self._entries[digest]
+                else:
+                    remaining = max(remaining, entry["refs"])
+                self._save()
+        return remaining
@@ -0,0 +1,166 @@
+"""Local high-value item classifier.
+
+A small logistic regression over word and lexicon features, trained at
+startup from the examples in the evaluate_value prompt and seed_data.py.
+Admin overrides are added as extra training rows and the model is
+refit in place; at this data size a fit takes well under a second.
+
+Raw logistic scores on a few dozen rows are far too sure of themselves,
+so confidences are temperature-scaled on cross-validated held-out scores,
+and items whose words pull both ways are never decided locally.
+"""
+
+import math
+import re
+
+from seed_data import ITEMS as SEED_ITEMS
+
+# Same lists the evaluate_value prompt gives the model
+HIGH_VALUE_EXAMPLES = [
+    "AirPods", "iPhone", "laptop", "tablet", "graphing calculator TI-84", "TI-Nspire calculator",
+    "smartwatch", "Apple Watch", "designer wallet", "prescription glasses", "car keys with fob",
+    "MacBook charger", "Beats headphones", "Bose headphones", "gaming device", "Nintendo Switch",
+    "jewelry", "class ring",
+]
+LOW_VALUE_EXAMPLES = [
+    "water bottle", "pen", "pencil", "notebook", "spiral binder", "umbrella", "lanyard", "hair tie",
+    "generic phone cable", "eraser", "folder", "lunch container", "plastic ruler",
+]
+
+# Lexicon features, so unseen phrasings of known brands still score
+HIGH_VALUE_TERMS = {
+    "airpods", "iphone", "ipad", "macbook", "laptop", "chromebook", "tablet", "calculator", "ti",
+    "nspire", "smartwatch", "watch", "fob", "beats", "bose", "sony", "nintendo", "switch", "xbox",
+    "playstation", "jewelry", "ring", "earrings", "necklace", "gold", "silver", "designer", "prescription",
+    "samsung", "galaxy", "pixel", "kindle", "camera", "letterman",
+}
+LOW_VALUE_TERMS = {
+    "bottle", "pen", "pencil", "pencils", "notebook", "binder", "spiral", "umbrella", "lanyard",
+    "tie", "cable", "eraser", "folder", "lunch", "container", "ruler", "glove", "sock", "hat",
+    "broken", "cracked", "empty", "worn", "generic", "supplies",
+}
+
+# Brands that also make cheap things ("Apple Pencil" is ~$100, a "Hydro Flask bottle" ~$45);
+# next to a low-value term they make the item ambiguous
+BRAND_TERMS = {
+    "apple", "samsung", "sony", "bose", "beats", "ti", "casio", "hydro", "flask", "yeti", "stanley",
+    "nike", "jordan", "adidas", "lululemon", "patagonia", "herschel", "logitech",
+}
+
+# Returned when high- and low-value signals conflict; below any sensible escalation threshold
+CONFLICT_CONFIDENCE = 0.5
+
+PROMPT_WEIGHT = 2.0   # prompt examples are the stated policy; seed labels count once
+EPOCHS = 300
+LEARNING_RATE = 0.3
+L2 = 0.001
+FOLDS = 5
+TEMPERATURES = [1.0 + 0.25 * i for i in range(37)]  # 1.0 .. 10.0
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def features(title, description="", category=""):
+    words = _WORD_RE.findall(f"{title} {description}".lower())
+    feats = {f"w:{w}" for w in words}
+    if category:
+        feats.add(f"c:{category.lower()}")
+    high = [w for w in words if w in HIGH_VALUE_TERMS]
+    low = [w for w in words if w in LOW_VALUE_TERMS]
+    brands = [w for w in words if w in BRAND_TERMS]
+    if high:
+        feats.add("lex:high")
+    if low:
+        feats.add("lex:low")
+    feats.add("bias")
+    return feats, high, low, brands
+
+
+class ValueClassifier:
+    def __init__(self):
+        self.weights = {}
+        self.temperature = 1.0
+        self.overrides = []
+
+    def _training_rows(self):
+        rows = []
+        for text in HIGH_VALUE_EXAMPLES:
+            rows.append((features(text)[0], 1, PROMPT_WEIGHT))
+        for text in LOW_VALUE_EXAMPLES:
+            rows.append((features(text)[0], 0, PROMPT_WEIGHT))
+        for item in SEED_ITEMS:
+            feats = features(item["title"], item.get("description", ""), item.get("category", ""))[0]
+            rows.append((feats, 1 if item.get("highValue") else 0, 1.0))
+        for override in self.overrides:
+            feats = features(override["title"], override.get("description", ""), override.get("category", ""))[0]
+            rows.append((feats, 1 if override["highValue"] else 0, PROMPT_WEIGHT))
+        return rows
+
+    @classmethod
+    def _train(cls, rows):
+        weights = {}
+        for _ in range(EPOCHS):
+            for feats, label, sample_weight in rows:
+                p = cls._prob(weights, feats)
+                step = LEARNING_RATE * sample_weight * (label - p)
+                for f in feats:
+                    w = weights.get(f, 0.0)
+                    weights[f] = w + step - LEARNING_RATE * L2 * w
+        return weights
+
+    @classmethod
+    def _calibrate(cls, rows):
+        """Temperature that minimises log loss on scores from folds the row was held out of."""
+        held_out = []
+        for fold in range(FOLDS):
+            weights = cls._train([row for i, row in enumerate(rows) if i % FOLDS != fold])
+            held_out += [(cls._score(weights, feats), label, sample_weight)
+                         for i, (feats, label, sample_weight) in enumerate(rows) if i % FOLDS == fold]
+
+        def log_loss(temperature):
+            loss = 0.0
+            for z, label, sample_weight in held_out:
+                p = 1.0 / (1.0 + math.exp(-z / temperature))
+                p = min(max(p, 1e-6), 1 - 1e-6)
+                loss -= sample_weight * math.log(p if label else 1 - p)
+            return loss
+
+        return min(TEMPERATURES, key=log_loss)
+
+    def fit(self):
+        rows = self._training_rows()
+        self.weights = self._train(rows)
+        self.temperature = self._calibrate(rows)
+
+    def add_override(self, title, description, category, high_value, refit=True):
+        self.overrides.append({
+            "title": title,
+            "description": description,
+            "category": category,
+            "highValue": bool(high_value),
+        })
+        if refit:
+            self.fit()
+
+    @staticmethod
+    def _score(weights, feats):
+        return max(-30.0, min(30.0, sum(weights.get(f, 0.0) for f in feats)))
+
+    @classmethod
+    def _prob(cls, weights, feats, temperature=1.0):
+        return 1.0 / (1.0 + math.exp(-cls._score(weights, feats) / temperature))
+
+    def predict(self, title, description="", category=""):
+        """Return (high_value, confidence, reason); confidence is the calibrated probability of the chosen class."""
+        feats, high, low, brands = features(title, description, category)
+        p = self._prob(self.weights, feats, self.temperature)
+        high_value = p >= 0.5
+        confidence = p if high_value else 1 - p
+        if low and (high or brands):
+            mixed = ', '.join(sorted(set(high + brands + low)))
+            return high_value, CONFLICT_CONFIDENCE, f"Mixed value signals ({mixed})."
+        if high_value:
+            reason = f"Looks like a high-value item ({', '.join(sorted(set(high))) or 'similar to past high-value items'})."
+        else:
+            reason = f"Looks like an everyday low-value item ({', '.join(sorted(set(low))) or 'similar to past low-value items'})."
+        return high_value, round(confidence, 3), reason
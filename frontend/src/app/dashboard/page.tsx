@@ -5,10 +5,11 @@ import { useAuth } from "@/context/auth-context";
 import { useRouter } from "next/navigation";
 import { useState, useEffect } from "react";
 import { Item, ItemCard } from "@/components/item-card";
-import { LayoutDashboard, Trash2, CheckCircle, Send } from "lucide-react";
-import { ref, remove, update, onValue, push, set } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { LayoutDashboard, Trash2, CheckCircle, Send, Gem } from "lucide-react";
+import { onValue } from "firebase/database";
+import { runAdminActions, saveValueOverride, AdminOperation } from "@/lib/admin-actions";
 import { Dialog } from "@/components/dialog";
+import { campusRef, campusHeaders } from "@/lib/campus";
 
 // Inquiry Type Definition: Represents a message from a user about an item
 type Inquiry = {
@@ -72,7 +73,7 @@ export default function Dashboard() {
         if (!user) return;
 
         // 1. Fetch Items from Firebase Realtime Database
-        const itemsRef = ref(db, 'items');
+        const itemsRef = campusRef('items');
         const unsubItems = onValue(itemsRef, (snapshot) => {
             const data = snapshot.val();
             const itemsList = data ? Object.entries(data).map(([id, val]: [string, any]) => ({ id, ...val })) : [];
@@ -93,7 +94,7 @@ export default function Dashboard() {
         // 2. Fetch Inquiries (Admin only)
         let unsubInquiries = () => { };
         if (role === 'ADMIN') {
-            const inqRef = ref(db, 'inquiries');
+            const inqRef = campusRef('inquiries');
             unsubInquiries = onValue(inqRef, (snapshot) => {
                 const data = snapshot.val();
                 const inqList = data ? Object.entries(data).map(([id, val]: [string, any]) => ({ id, ...val })) : [];
@@ -104,7 +105,7 @@ export default function Dashboard() {
         // 3. Fetch Claims (Admin only)
         let unsubClaims = () => { };
         if (role === 'ADMIN') {
-            const claimsRef = ref(db, 'claims');
+            const claimsRef = campusRef('claims');
             unsubClaims = onValue(claimsRef, (snapshot) => {
                 const data = snapshot.val();
                 const claimsList = data ? Object.entries(data).map(([id, val]: [string, any]) => ({ id, ...val })) : [];
@@ -129,35 +130,23 @@ export default function Dashboard() {
     // Handler to proceed with item deletion
     const confirmDelete = async () => {
         if (itemToDelete) {
-            await remove(ref(db, `items/${itemToDelete}`));
+            try {
+                await runAdminActions(user, [{ op: "delete_item", item_id: itemToDelete }]);
+            } catch (e) {
+                alert("Failed to delete item");
+            }
             setItemToDelete(null);
             setIsDeleteDialogOpen(false);
         }
     };
 
-    // Helper to generate a random pickup code
-    const generatePickupCode = () => {
-        const chars = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789";
-        let code = "";
-        for (let i = 0; i < 6; i++) code += chars[Math.floor(Math.random() * chars.length)];
-        return code;
-    };
-
-    // Helper to create a notification
-    const createNotification = async (data: {
-        userId: string;
-        type: string;
-        title: string;
-        message: string;
-        pickupLocation?: string;
-        pickupCode?: string;
-    }) => {
-        const notifRef = push(ref(db, "notifications"));
-        await set(notifRef, {
-            ...data,
-            read: false,
-            createdAt: new Date().toISOString(),
-        });
+    // Flip an item's high-value flag; the backend learns from the correction
+    const handleValueOverride = async (item: Item) => {
+        try {
+            await saveValueOverride(user, item, !item.highValue);
+        } catch (e) {
+            alert("Failed to update item value");
+        }
     };
 
     // Find potential matches between lost and found items using category + keyword overlap
@@ -178,17 +167,18 @@ export default function Dashboard() {
             .map(({ item }) => item);
     };
 
-    // Update item status (e.g., approve a pending item), notify owner, and auto-match
+    // Update item status (e.g., approve a pending item), notify owner, and auto-match,
+    // all applied by the backend as one atomic write
     const handleStatus = async (itemId: string, status: string) => {
         const item = allItems.find((i) => i.id === itemId);
-        await update(ref(db, `items/${itemId}`), { status });
+        const statusOp: AdminOperation = { op: "set_item_status", item_id: itemId, status };
 
         // AI value check when approving items not already flagged as high-value
         if (item && status === "APPROVED" && !item.highValue) {
             try {
                 const evalRes = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/evaluate-value`, {
                     method: "POST",
-                    headers: { "Content-Type": "application/json" },
+                    headers: campusHeaders({ "Content-Type": "application/json" }),
                     body: JSON.stringify({
                         title: item.title,
                         description: item.description,
@@ -198,29 +188,14 @@ export default function Dashboard() {
                 if (evalRes.ok) {
                     const evalData = await evalRes.json();
                     if (evalData.highValue) {
-                        await update(ref(db, `items/${itemId}`), { highValue: true });
+                        statusOp.high_value = true;
                     }
                 }
             } catch { /* non-blocking */ }
         }
 
-        if (item && item.owner && item.owner !== "seed_script") {
-            if (status === "APPROVED") {
-                await createNotification({
-                    userId: item.owner,
-                    type: "ITEM_APPROVED",
-                    title: "Item Approved",
-                    message: `Your report "${item.title}" has been approved and is now visible to other students.`,
-                });
-            } else if (status === "REJECTED") {
-                await createNotification({
-                    userId: item.owner,
-                    type: "ITEM_REJECTED",
-                    title: "Item Rejected",
-                    message: `Your report "${item.title}" was not approved. Please contact an administrator if you have questions.`,
-                });
-            }
-        }
+        // The backend notifies the owner when the item is approved or rejected
+        const operations: AdminOperation[] = [statusOp];
 
         // Auto-match: when approving, notify owners of opposite-type items that may match
         if (item && status === "APPROVED") {
@@ -235,32 +210,32 @@ export default function Dashboard() {
             for (const match of notifyTargets) {
                 if (match.owner && match.owner !== "seed_script") {
                     // If we approved a FOUND item, notify people who LOST something similar
-                    // If we approved a LOST item, notify people who FOUND something similar
+                    // If we approved a LOST item, notify the lost reporter about the existing found item
                     if (item.type === "FOUND") {
-                        // Notify the person who lost a similar item
-                        await createNotification({
-                            userId: match.owner,
+                        operations.push({
+                            op: "notify",
+                            user_id: match.owner,
                             type: "MATCH_FOUND",
                             title: "Possible Match Found",
                             message: `A found item "${item.title}" was just posted that may match your lost "${match.title}". Check the Browse Items page to see if it's yours.`,
                         });
-                    } else {
-                        // item.type === "LOST" -- notify the person who found a similar item
-                        // But also notify the lost item owner about the existing found item
-                        if (item.owner && item.owner !== "seed_script") {
-                            await createNotification({
-                                userId: item.owner,
-                                type: "MATCH_FOUND",
-                                title: "Possible Match Found",
-                                message: `An existing found item "${match.title}" may match your lost "${item.title}". Check the Browse Items page to see if it's yours.`,
-                            });
-                        }
+                    } else if (item.owner && item.owner !== "seed_script") {
+                        operations.push({
+                            op: "notify",
+                            user_id: item.owner,
+                            type: "MATCH_FOUND",
+                            title: "Possible Match Found",
+                            message: `An existing found item "${match.title}" may match your lost "${item.title}". Check the Browse Items page to see if it's yours.`,
+                        });
                     }
                 }
             }
+        }
 
-            // If a LOST item was approved and there are matches, also notify the lost reporter directly
-            // (handled above for each match -- the lost reporter gets up to 3 notifications for matches)
+        try {
+            await runAdminActions(user, operations);
+        } catch (e) {
+            alert("Failed to update item status");
         }
     };
 
@@ -270,19 +245,7 @@ export default function Dashboard() {
         if (!reply) return;
 
         try {
-            const inquiry = inquiries.find((i) => i.id === inquiryId);
-            await update(ref(db, `inquiries/${inquiryId}`), {
-                adminReply: reply,
-                status: "RESOLVED"
-            });
-            if (inquiry) {
-                await createNotification({
-                    userId: inquiry.userId,
-                    type: "INQUIRY_REPLY",
-                    title: "Admin Reply",
-                    message: `An admin replied to your inquiry about "${inquiry.itemTitle}": "${reply}"`,
-                });
-            }
+            await runAdminActions(user, [{ op: "reply_inquiry", inquiry_id: inquiryId, message: reply }]);
             setReplyText(prev => {
                 const next = { ...prev };
                 delete next[inquiryId];
@@ -293,34 +256,10 @@ export default function Dashboard() {
         }
     };
 
-    // Update claim status, notify claimant, and handle item lifecycle
+    // Update claim status, notify claimant, and handle item lifecycle (one backend round trip)
     const handleClaimStatus = async (claimId: string, itemId: string, newStatus: string) => {
         try {
-            const claim = claims.find((c) => c.id === claimId);
-            const item = allItems.find((i) => i.id === itemId);
-
-            await update(ref(db, `claims/${claimId}`), { status: newStatus });
-
-            if (newStatus === "APPROVED" && claim && item) {
-                const pickupCode = generatePickupCode();
-                await createNotification({
-                    userId: claim.userId,
-                    type: "CLAIM_APPROVED",
-                    title: "Claim Approved",
-                    message: `Your claim for "${claim.itemTitle}" has been approved. Show your pickup code to collect the item.`,
-                    pickupLocation: item.location,
-                    pickupCode,
-                });
-                // Remove item from public listings
-                await remove(ref(db, `items/${itemId}`));
-            } else if (newStatus === "REJECTED" && claim) {
-                await createNotification({
-                    userId: claim.userId,
-                    type: "CLAIM_REJECTED",
-                    title: "Claim Not Approved",
-                    message: `Your claim for "${claim.itemTitle}" was not approved. The information provided did not match the item details.`,
-                });
-            }
+            await runAdminActions(user, [{ op: "resolve_claim", claim_id: claimId, item_id: itemId, status: newStatus }]);
         } catch (e) {
             alert("Failed to update claim status");
         }
@@ -582,6 +521,14 @@ export default function Dashboard() {
                                                     <button onClick={() => handleDelete(item.id)} aria-label={`Delete ${item.title}`} className="p-2 hover:bg-red-50 text-red-500 rounded-lg transition-colors">
                                                         <Trash2 className="w-4 h-4" aria-hidden="true" />
                                                     </button>
+                                                    <button
+                                                        onClick={() => handleValueOverride(item)}
+                                                        aria-label={item.highValue ? `Mark ${item.title} as not high value` : `Mark ${item.title} as high value`}
+                                                        aria-pressed={!!item.highValue}
+                                                        className={`p-2 rounded-lg transition-colors ${item.highValue ? "bg-yellow-100 text-yellow-600 hover:bg-yellow-200" : "text-gray-400 hover:bg-yellow-50 hover:text-yellow-600"}`}
+                                                    >
+                                                        <Gem className="w-4 h-4" aria-hidden="true" />
+                                                    </button>
                                                     {item.status !== "APPROVED" && (
                                                         <button onClick={() => handleStatus(item.id, "APPROVED")} aria-label={`Approve ${item.title}`} className="p-2 hover:bg-green-50 text-green-500 rounded-lg transition-colors">
                                                             <CheckCircle className="w-4 h-4" aria-hidden="true" />
@@ -4,12 +4,12 @@ import { Navbar } from "@/components/navbar";
 import { useState, useEffect } from "react";
 import { useAuth } from "@/context/auth-context";
 import { useRouter, useParams } from "next/navigation";
-import { push, ref, set, get } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { push, set, get } from "firebase/database";
 import { Loader2, ShieldCheck, ShieldAlert, Camera, X } from "lucide-react";
 import { Dialog } from "@/components/dialog";
 import Image from "next/image";
 import { convertImageToJpeg } from "@/lib/image-utils";
+import { campusRef, campusHeaders } from "@/lib/campus";
 
 export default function ClaimPage() {
     const { user, loading } = useAuth();
@@ -46,7 +46,7 @@ export default function ClaimPage() {
         if (!loading && !user) router.push("/login");
 
         if (params.id) {
-            get(ref(db, `items/${params.id}`)).then((snapshot) => {
+            get(campusRef(`items/${params.id}`)).then((snapshot) => {
                 if (snapshot.exists()) {
                     const data = snapshot.val();
                     setItemTitle(data.title);
@@ -63,7 +63,7 @@ export default function ClaimPage() {
         try {
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/upload-image`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({ image_base64: imageBase64 })
             });
             const data = await res.json();
@@ -118,7 +118,7 @@ export default function ClaimPage() {
                 setIsUploading(false);
             }
 
-            const claimRef = push(ref(db, 'claims'));
+            const claimRef = push(campusRef('claims'));
             await set(claimRef, {
                 itemId: params.id,
                 userId: user.uid,
@@ -4,10 +4,10 @@ import { Navbar } from "@/components/navbar";
 import { useState, useEffect } from "react";
 import { useAuth } from "@/context/auth-context";
 import { useRouter, useParams } from "next/navigation";
-import { push, ref, set, get } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { push, set, get } from "firebase/database";
 import { Loader2, Send } from "lucide-react";
 import { Dialog } from "@/components/dialog";
+import { campusRef } from "@/lib/campus";
 
 export default function InquiryPage() {
     const { user, loading } = useAuth();
@@ -41,7 +41,7 @@ export default function InquiryPage() {
         if (!loading && !user) router.push("/login");
 
         if (params.id) {
-            get(ref(db, `items/${params.id}`)).then((snapshot) => {
+            get(campusRef(`items/${params.id}`)).then((snapshot) => {
                 if (snapshot.exists()) {
                     setItemTitle(snapshot.val().title);
                 }
@@ -55,7 +55,7 @@ export default function InquiryPage() {
         setIsSubmitting(true);
 
         try {
-            const notifRef = push(ref(db, 'inquiries'));
+            const notifRef = push(campusRef('inquiries'));
             await set(notifRef, {
                 itemId: params.id,
                 userId: user.uid,
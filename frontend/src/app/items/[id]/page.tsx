@@ -8,10 +8,10 @@ import Link from "next/link";
 import { notFound, useParams, useRouter } from "next/navigation";
 import { cn } from "@/lib/utils";
 import { useEffect, useState } from "react";
-import { ref, get, onValue, remove, push, set } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { get } from "firebase/database";
 import { useAuth } from "@/context/auth-context";
 import { Dialog } from "@/components/dialog";
+import { campusRef, campusHeaders } from "@/lib/campus";
 
 export default function ItemDetail() {
     const params = useParams();
@@ -29,18 +29,13 @@ export default function ItemDetail() {
         if (!user || !item) return;
         setClaiming(true);
         try {
-            // Create notification with pickup location
-            const notifRef = push(ref(db, "notifications"));
-            await set(notifRef, {
-                userId: user.uid,
-                type: "ITEM_CLAIMED",
-                title: "Item Claimed",
-                message: `You claimed "${item.title}". Pick it up at ${item.location}.`,
-                read: false,
-                createdAt: new Date().toISOString(),
+            // The backend notifies the student and moves the item to the archive in one write
+            const token = await user.getIdToken();
+            const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/items/${item.id}/claim`, {
+                method: "POST",
+                headers: campusHeaders({ Authorization: `Bearer ${token}` })
             });
-            // Remove item from listings
-            await remove(ref(db, `items/${item.id}`));
+            if (!res.ok) throw new Error("Claim request failed");
             setDialogState({
                 isOpen: true,
                 title: "Item Claimed!",
@@ -62,7 +57,7 @@ export default function ItemDetail() {
 
     useEffect(() => {
         if (params.id) {
-            get(ref(db, `items/${params.id}`)).then((snapshot) => {
+            get(campusRef(`items/${params.id}`)).then((snapshot) => {
                 if (snapshot.exists()) {
                     setItem({ id: params.id as string, ...snapshot.val() });
                 }
@@ -74,34 +69,38 @@ export default function ItemDetail() {
     // Find potential matches of the opposite type
     useEffect(() => {
         if (!item) return;
-        const itemsRef = ref(db, "items");
-        const unsub = onValue(itemsRef, (snapshot) => {
-            const data = snapshot.val();
-            if (!data) return;
-            const oppositeType = item.type === "LOST" ? "FOUND" : "LOST";
-            const candidates = Object.entries(data)
-                .map(([id, val]: [string, any]) => ({ id, ...val } as Item))
-                .filter((i) => i.type === oppositeType && i.status === "APPROVED" && i.category === item.category);
+        let cancelled = false;
+        // Approved opposite-type items in the same category, newest first, from the recency feed
+        const oppositeType = item.type === "LOST" ? "FOUND" : "LOST";
+        const params = new URLSearchParams({ limit: "50", category: item.category, type: oppositeType });
+        fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/feed?${params}`, { headers: campusHeaders() })
+            .then((res) => (res.ok ? res.json() : { results: [] }))
+            .then((data) => {
+                if (cancelled) return;
+                const candidates = (data.results as Item[]).filter((i) => i.id !== item.id);
 
-            // Score by keyword overlap
-            const titleWords = item.title.toLowerCase().split(/\s+/);
-            const descWords = item.description.toLowerCase().split(/\s+/);
-            const words = [...titleWords, ...descWords].filter((w) => w.length > 3);
+                // Score by keyword overlap
+                const titleWords = item.title.toLowerCase().split(/\s+/);
+                const descWords = item.description.toLowerCase().split(/\s+/);
+                const words = [...titleWords, ...descWords].filter((w) => w.length > 3);
 
-            const scored = candidates
-                .map((c) => {
-                    const text = (c.title + " " + c.description).toLowerCase();
-                    const score = words.filter((w) => text.includes(w)).length;
-                    return { item: c, score };
-                })
-                .filter(({ score }) => score > 0)
-                .sort((a, b) => b.score - a.score)
-                .slice(0, 3)
-                .map(({ item }) => item);
+                const scored = candidates
+                    .map((c) => {
+                        const text = (c.title + " " + c.description).toLowerCase();
+                        const score = words.filter((w) => text.includes(w)).length;
+                        return { item: c, score };
+                    })
+                    .filter(({ score }) => score > 0)
+                    .sort((a, b) => b.score - a.score)
+                    .slice(0, 3)
+                    .map(({ item }) => item);
 
-            setMatches(scored);
-        });
-        return () => unsub();
+                setMatches(scored);
+            })
+            .catch((e) => console.error("Feed error:", e));
+        return () => {
+            cancelled = true;
+        };
     }, [item]);
 
     if (loading) return <div className="p-10 text-center">Loading...</div>;
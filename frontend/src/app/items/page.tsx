@@ -2,12 +2,17 @@
 
 import { Navbar } from "@/components/navbar";
 import { ItemCard, Item } from "@/components/item-card";
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { Search, Filter, Sparkles, Loader2 } from "lucide-react";
 import { useAuth } from "@/context/auth-context";
 import { useRouter, useSearchParams } from "next/navigation";
-import { ref, onValue } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { campusHeaders } from "@/lib/campus";
+
+const FEED_LIMIT = 50; // the backend's FEED_MAX_LIMIT
+const FEED_REFRESH_MS = 30000;
+const SUGGEST_DEBOUNCE_MS = 150;
+
+type Suggestion = { text: string; kind: "title" | "category" | "location"; count: number };
 
 export default function ItemsPage() {
     const { user, loading } = useAuth();
@@ -21,28 +26,82 @@ export default function ItemsPage() {
     const [categoryFilter, setCategoryFilter] = useState(searchParams.get("category") || "");
     const [isAISearching, setIsAISearching] = useState(false);
     const [correctedQuery, setCorrectedQuery] = useState("");
+    // While search results are shown, feed refreshes must not replace them
+    const searchActive = useRef(false);
+    const [suggestions, setSuggestions] = useState<Suggestion[]>([]);
+    const [showSuggestions, setShowSuggestions] = useState(false);
 
     useEffect(() => {
         if (!loading && !user) router.push("/login");
+    }, [user, loading, router]);
 
-        if (user) {
-            const itemsRef = ref(db, 'items');
-            onValue(itemsRef, (snapshot) => {
-                const data = snapshot.val();
-                if (data) {
-                    const itemList = Object.entries(data).map(([id, val]: [string, any]) => ({
-                        id,
-                        ...val
-                    })).filter((item: Item) => item.status === "APPROVED");
-                    setItems(itemList);
-                    setDisplayedItems(itemList);
-                } else {
-                    setItems([]);
-                    setDisplayedItems([]);
-                }
-            });
+    // Newest approved items from the backend's recency feed, filtered server-side. Polled
+    // rather than subscribing to the whole items tree, which downloads every listing.
+    useEffect(() => {
+        if (!user) return;
+        let cancelled = false;
+
+        const loadFeed = async () => {
+            const params = new URLSearchParams({ limit: String(FEED_LIMIT) });
+            if (filter !== "ALL") params.set("type", filter);
+            if (categoryFilter) params.set("category", categoryFilter);
+            try {
+                const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/feed?${params}`, {
+                    headers: campusHeaders()
+                });
+                if (!res.ok || cancelled) return;
+                const data = await res.json();
+                setItems(data.results);
+                if (!searchActive.current) setDisplayedItems(data.results);
+            } catch (e) {
+                console.error("Feed error:", e);
+            }
+        };
+
+        loadFeed();
+        const timer = setInterval(loadFeed, FEED_REFRESH_MS);
+        return () => {
+            cancelled = true;
+            clearInterval(timer);
+        };
+    }, [user, filter, categoryFilter]);
+
+    // Typeahead from the backend's prefix index (no AI call), debounced while typing
+    useEffect(() => {
+        if (!showSuggestions || !search.trim()) {
+            setSuggestions([]);
+            return;
         }
-    }, [user, loading, router]);
+        const controller = new AbortController();
+        const timer = setTimeout(async () => {
+            try {
+                const params = new URLSearchParams({ q: search.trim() });
+                const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/suggest?${params}`, {
+                    headers: campusHeaders(),
+                    signal: controller.signal
+                });
+                if (res.ok) setSuggestions((await res.json()).suggestions);
+            } catch (e) {
+                if ((e as Error).name !== "AbortError") console.error("Suggest error:", e);
+            }
+        }, SUGGEST_DEBOUNCE_MS);
+        return () => {
+            clearTimeout(timer);
+            controller.abort();
+        };
+    }, [search, showSuggestions]);
+
+    const pickSuggestion = (suggestion: Suggestion) => {
+        setShowSuggestions(false);
+        if (suggestion.kind === "category") {
+            setCategoryFilter(suggestion.text);
+            setSearch("");
+            performAISearch("");
+            return;
+        }
+        setSearch(suggestion.text);
+        performAISearch(suggestion.text);
+    };
 
     // Handle search from URL params on mount
     useEffect(() => {
@@ -59,6 +118,7 @@ export default function ItemsPage() {
     }, [searchParams]);
 
     const performAISearch = async (query: string) => {
+        searchActive.current = !!query.trim();
         if (!query.trim()) {
             setDisplayedItems(items);
             setCorrectedQuery("");
@@ -69,7 +129,7 @@ export default function ItemsPage() {
         try {
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/ai-search`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({ query })
             });
 
@@ -111,6 +171,7 @@ export default function ItemsPage() {
 
     const handleSearchSubmit = (e: React.FormEvent) => {
         e.preventDefault();
+        setShowSuggestions(false);
         performAISearch(search);
     };
 
@@ -144,10 +205,47 @@ export default function ItemsPage() {
                                 type="text"
                                 placeholder="Search items..."
                                 value={search}
-                                onChange={(e) => setSearch(e.target.value)}
+                                onChange={(e) => {
+                                    setSearch(e.target.value);
+                                    setShowSuggestions(true);
+                                }}
+                                onKeyDown={(e) => {
+                                    if (e.key === "Enter") handleSearchSubmit(e);
+                                    if (e.key === "Escape") setShowSuggestions(false);
+                                }}
+                                onBlur={() => setShowSuggestions(false)}
+                                role="combobox"
+                                aria-expanded={showSuggestions && suggestions.length > 0}
+                                aria-controls="items-search-suggestions"
+                                aria-autocomplete="list"
+                                autoComplete="off"
                                 className="pl-10 pr-4 py-2 rounded-xl border border-gray-300 bg-gray-50 text-gray-900 focus:ring-1 focus:ring-fbla-blue outline-none w-full sm:w-64"
                             />
                             <Search className="absolute left-3 top-2.5 w-4 h-4 text-gray-400" aria-hidden="true" />
+                            {showSuggestions && suggestions.length > 0 && (
+                                <ul
+                                    id="items-search-suggestions"
+                                    role="listbox"
+                                    className="absolute z-10 mt-1 w-full bg-white border border-gray-200 rounded-xl shadow-lg overflow-hidden"
+                                >
+                                    {suggestions.map((suggestion) => (
+                                        <li
+                                            key={`${suggestion.kind}:${suggestion.text}`}
+                                            role="option"
+                                            aria-selected={false}
+                                            // mousedown fires before the input's blur closes the list
+                                            onMouseDown={(e) => {
+                                                e.preventDefault();
+                                                pickSuggestion(suggestion);
+                                            }}
+                                            className="px-4 py-2 text-sm cursor-pointer hover:bg-gray-50 flex justify-between gap-2"
+                                        >
+                                            <span className="truncate">{suggestion.text}</span>
+                                            <span className="text-xs text-gray-400 capitalize">{suggestion.kind}</span>
+                                        </li>
+                                    ))}
+                                </ul>
+                            )}
                         </div>
 
                         {/* Filter Buttons */}
@@ -3,10 +3,10 @@
 import { Navbar } from "@/components/navbar";
 import { useAuth } from "@/context/auth-context";
 import { useState, useEffect } from "react";
-import { ref, onValue } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { onValue } from "firebase/database";
 import { Bell, CheckCircle, XCircle, MessageSquare, MapPin, Key, Search } from "lucide-react";
 import { QRCodeSVG } from "qrcode.react";
+import { campusRef } from "@/lib/campus";
 
 type Notification = {
     id: string;
@@ -25,7 +25,7 @@ export default function NotificationsPage() {
 
     useEffect(() => {
         if (user) {
-            const notifsRef = ref(db, 'notifications');
+            const notifsRef = campusRef('notifications');
             onValue(notifsRef, (snapshot) => {
                 const data = snapshot.val();
                 if (data) {
@@ -8,11 +8,11 @@ import Link from "next/link";
 import Image from "next/image";
 import { useAuth } from "@/context/auth-context";
 import { useRouter } from "next/navigation";
-import { push, ref, set, get } from "firebase/database";
+import { push, set, get } from "firebase/database";
 import { Item } from "@/components/item-card";
-import { db } from "@/lib/firebase";
 import { Dialog } from "@/components/dialog";
 import { convertImageToJpeg } from "@/lib/image-utils";
+import { campusRef, campusHeaders } from "@/lib/campus";
 
 export default function ReportPage() {
     const { user, loading } = useAuth();
@@ -25,6 +25,8 @@ export default function ReportPage() {
     const [imageModerationResult, setImageModerationResult] = useState<{ approved: boolean; reason: string } | null>(null);
     const [isModeratingImage, setIsModeratingImage] = useState(false);
     const [potentialMatches, setPotentialMatches] = useState<Item[]>([]);
+    const [duplicateMatches, setDuplicateMatches] = useState<{ id: string; title: string }[]>([]);
+    const [duplicatesAcknowledged, setDuplicatesAcknowledged] = useState(false);
     const [formData, setFormData] = useState({
         type: "LOST",
         title: "",
@@ -34,6 +36,7 @@ export default function ReportPage() {
         description: "",
         image: null as string | null,
         imageUrl: null as string | null,  // Cloudinary URL
+        imageHash: null as string | null, // Perceptual hash from the upload, for duplicate checks
         highValue: false
     });
 
@@ -57,15 +60,15 @@ export default function ReportPage() {
         if (!loading && !user) router.push("/login");
     }, [user, loading, router]);
 
-    const uploadImage = async (imageBase64: string): Promise<string | null> => {
+    const uploadImage = async (imageBase64: string): Promise<{ url: string; imageHash: string | null } | null> => {
         try {
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/upload-image`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({ image_base64: imageBase64 })
             });
             const data = await res.json();
-            if (data.url) return data.url;
+            if (data.url) return { url: data.url, imageHash: data.imageHash || null };
             throw new Error("Upload failed");
         } catch (e) {
             console.error("Image upload error:", e);
@@ -73,11 +76,38 @@ export default function ReportPage() {
         }
     };
 
+    // With itemId the backend also flags the stored listing, which needs the owner's ID token
+    const checkDuplicates = async (imageHash: string | null, itemId?: string) => {
+        try {
+            const headers: Record<string, string> = { "Content-Type": "application/json" };
+            if (itemId && user) headers.Authorization = `Bearer ${await user.getIdToken()}`;
+            const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/check-duplicate`, {
+                method: "POST",
+                headers: campusHeaders(headers),
+                body: JSON.stringify({
+                    title: formData.title,
+                    description: formData.description,
+                    type: formData.type,
+                    image_hash: imageHash,
+                    item_id: itemId
+                })
+            });
+            if (res.ok) {
+                const data = await res.json();
+                return (data.matches || []) as { id: string; title: string }[];
+            }
+            return [];
+        } catch (e) {
+            console.error("Duplicate check error:", e);
+            return []; // Non-blocking
+        }
+    };
+
     const moderateContent = async (): Promise<boolean> => {
         try {
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/moderate-content`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({
                     title: formData.title,
                     description: formData.description,
@@ -106,7 +136,7 @@ export default function ReportPage() {
             setIsModeratingImage(true);
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/moderate-image`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({ image_url: imageUrl })
             });
 
@@ -137,26 +167,40 @@ export default function ReportPage() {
         setImageModerationResult(null);
 
         try {
-            // Step 1: AI Content Moderation (text)
-            const isTextApproved = await moderateContent();
-            if (!isTextApproved) {
-                setIsSubmitting(false);
-                return; // Block submission
-            }
-
-            // Step 2: Upload image if present
+            // Step 1: Upload image if present (the upload returns the hash used for duplicate checks)
             let imageUrl = formData.imageUrl;
+            let imageHash = formData.imageHash;
             if (formData.image && !formData.imageUrl) {
                 setIsUploading(true);
-                imageUrl = await uploadImage(formData.image);
+                const uploaded = await uploadImage(formData.image);
                 setIsUploading(false);
 
-                if (imageUrl) {
-                    setFormData(prev => ({ ...prev, imageUrl }));
+                if (uploaded) {
+                    imageUrl = uploaded.url;
+                    imageHash = uploaded.imageHash;
+                    setFormData(prev => ({ ...prev, imageUrl: uploaded.url, imageHash: uploaded.imageHash }));
                 }
             }
 
-            // Step 3: AI Image Moderation (if image was uploaded)
+            // Step 2: Duplicate check, before any AI calls are spent on the submission
+            if (!duplicatesAcknowledged) {
+                const duplicates = await checkDuplicates(imageHash);
+                if (duplicates.length > 0) {
+                    setDuplicateMatches(duplicates);
+                    setDuplicatesAcknowledged(true);
+                    setIsSubmitting(false);
+                    return; // Let the user look at the existing listings first
+                }
+            }
+
+            // Step 3: AI Content Moderation (text)
+            const isTextApproved = await moderateContent();
+            if (!isTextApproved) {
+                setIsSubmitting(false);
+                return; // Block submission
+            }
+
+            // Step 4: AI Image Moderation (if image was uploaded)
             if (imageUrl) {
                 const isImageApproved = await moderateImage(imageUrl);
                 if (!isImageApproved) {
@@ -165,8 +209,8 @@ export default function ReportPage() {
                 }
             }
 
-            // Step 4: Submit to Firebase
-            const newItemRef = push(ref(db, 'items'));
+            // Step 5: Submit to Firebase
+            const newItemRef = push(campusRef('items'));
             const itemId = newItemRef.key;
             await set(newItemRef, {
                 title: formData.title,
@@ -178,15 +222,19 @@ export default function ReportPage() {
                 owner: user.uid,
                 status: "PENDING",
                 imageUrl: imageUrl || "",
+                imageHash: imageHash || null,
                 highValue: formData.highValue,
                 createdAt: new Date().toISOString()
             });
 
-            // Step 5: AI Value Evaluation (may auto-upgrade to high-value)
+            // Record the new listing in the duplicate index and flag it for admins if it matches
+            if (itemId) checkDuplicates(imageHash, itemId);
+
+            // Step 6: AI Value Evaluation (may auto-upgrade to high-value)
             try {
                 const evalRes = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/evaluate-value`, {
                     method: "POST",
-                    headers: { "Content-Type": "application/json" },
+                    headers: campusHeaders({ "Content-Type": "application/json" }),
                     body: JSON.stringify({
                         title: formData.title,
                         description: formData.description,
@@ -197,7 +245,7 @@ export default function ReportPage() {
                     const evalData = await evalRes.json();
                     if (evalData.highValue && !formData.highValue) {
                         const { update: fbUpdate } = await import("firebase/database");
-                        await fbUpdate(ref(db, `items/${itemId}`), { highValue: true });
+                        await fbUpdate(campusRef(`items/${itemId}`), { highValue: true });
                     }
                 }
             } catch (e) {
@@ -206,7 +254,7 @@ export default function ReportPage() {
 
             // Find potential matches of opposite type
             try {
-                const snapshot = await get(ref(db, "items"));
+                const snapshot = await get(campusRef("items"));
                 if (snapshot.exists()) {
                     const data = snapshot.val();
                     const oppositeType = formData.type === "LOST" ? "FOUND" : "LOST";
@@ -246,7 +294,8 @@ export default function ReportPage() {
         if (!file) return;
         try {
             const jpegDataUrl = await convertImageToJpeg(file);
-            setFormData(prev => ({ ...prev, image: jpegDataUrl, imageUrl: null }));
+            setFormData(prev => ({ ...prev, image: jpegDataUrl, imageUrl: null, imageHash: null }));
+            setDuplicatesAcknowledged(false);
         } catch (err) {
             console.error("Image conversion error:", err);
             showDialog("Unsupported Image", "Could not process this image format. Please try a JPEG or PNG file.", "warning");
@@ -261,9 +310,10 @@ export default function ReportPage() {
             // First upload to get URL
             let imageUrl = formData.imageUrl;
             if (!imageUrl) {
-                imageUrl = await uploadImage(formData.image);
-                if (imageUrl) {
-                    setFormData(prev => ({ ...prev, imageUrl }));
+                const uploaded = await uploadImage(formData.image);
+                if (uploaded) {
+                    imageUrl = uploaded.url;
+                    setFormData(prev => ({ ...prev, imageUrl: uploaded.url, imageHash: uploaded.imageHash }));
                 }
             }
 
@@ -275,7 +325,7 @@ export default function ReportPage() {
 
             const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/describe-image`, {
                 method: "POST",
-                headers: { "Content-Type": "application/json" },
+                headers: campusHeaders({ "Content-Type": "application/json" }),
                 body: JSON.stringify({ image_url: imageUrl })
             });
 
@@ -343,6 +393,24 @@ export default function ReportPage() {
                                     </div>
                                 )}
 
+                                {/* Possible duplicates of an existing listing */}
+                                {duplicateMatches.length > 0 && (
+                                    <div role="alert" className="mb-6 p-4 bg-yellow-50 border border-yellow-200 rounded-xl flex items-start gap-3">
+                                        <ShieldAlert className="w-6 h-6 text-yellow-600 shrink-0 mt-0.5" aria-hidden="true" />
+                                        <div>
+                                            <p className="font-bold text-yellow-700">This may already be listed</p>
+                                            <p className="text-sm text-yellow-700 mb-2">Check these listings first. Submit again if yours is a different item.</p>
+                                            <ul className="text-sm space-y-1">
+                                                {duplicateMatches.map((m) => (
+                                                    <li key={m.id}>
+                                                        <Link href={`/items/${m.id}`} className="text-fbla-blue font-bold hover:underline">{m.title}</Link>
+                                                    </li>
+                                                ))}
+                                            </ul>
+                                        </div>
+                                    </div>
+                                )}
+
                                 <form onSubmit={handleSubmit} className="space-y-6 bg-white p-4 md:p-8 rounded-3xl border border-gray-200 shadow-xl">
                                     {/* ... form fields ... */}
                                     <div className="flex gap-4 p-1 bg-gray-100 rounded-xl">
@@ -522,7 +590,7 @@ export default function ReportPage() {
                                         </button>
                                     </Link>
                                     <button
-                                        onClick={() => { setStep(1); setFormData({ type: "LOST", title: "", category: "", date: "", location: "", description: "", image: null, imageUrl: null, highValue: false }); setModerationResult(null); setImageModerationResult(null); setPotentialMatches([]); }}
+                                        onClick={() => { setStep(1); setFormData({ type: "LOST", title: "", category: "", date: "", location: "", description: "", image: null, imageUrl: null, imageHash: null, highValue: false }); setModerationResult(null); setImageModerationResult(null); setPotentialMatches([]); setDuplicateMatches([]); setDuplicatesAcknowledged(false); }}
                                         className="px-6 py-3 rounded-xl bg-fbla-blue text-white font-bold hover:bg-blue-800 transition-colors"
                                     >
                                         Report Another
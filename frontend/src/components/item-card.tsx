@@ -6,8 +6,7 @@ import Image from "next/image";
 import Link from "next/link";
 import { cn } from "@/lib/utils";
 import { useAuth } from "@/context/auth-context";
-import { ref, update } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { runAdminActions } from "@/lib/admin-actions";
 import { useState } from "react";
 import { Dialog } from "@/components/dialog";
 
@@ -26,14 +25,12 @@ export type Item = {
 };
 
 export function ItemCard({ item, hideActions, isAdmin }: { item: Item; hideActions?: boolean; isAdmin?: boolean }) {
-    const { role } = useAuth();
+    const { user, role } = useAuth();
     const [error, setError] = useState<string | null>(null);
 
     const handleStatusChange = async (newStatus: string) => {
         try {
-            await update(ref(db, `items/${item.id}`), {
-                status: newStatus
-            });
+            await runAdminActions(user, [{ op: "set_item_status", item_id: item.id, status: newStatus }]);
         } catch (e) {
             setError("Failed to update status. Please try again.");
         }
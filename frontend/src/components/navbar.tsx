@@ -5,8 +5,8 @@ import { useState, useEffect, useRef, useCallback } from "react";
 import { Menu, X, Bell, LogOut, MessageSquare, ChevronRight, Search, Sun, Moon, CheckCircle } from "lucide-react";
 import { useAuth } from "@/context/auth-context";
 
-import { ref, onValue, update } from "firebase/database";
-import { db } from "@/lib/firebase";
+import { onValue, update } from "firebase/database";
+import { campusRef } from "@/lib/campus";
 
 // Notification Data Structure
 type Notification = {
@@ -41,7 +41,7 @@ export function Navbar() {
     // Effect: Listen for notifications for the logged-in user
     useEffect(() => {
         if (user) {
-            const notifsRef = ref(db, 'notifications');
+            const notifsRef = campusRef('notifications');
             const unsubscribe = onValue(notifsRef, (snapshot) => {
                 const data = snapshot.val();
                 if (data) {
@@ -69,7 +69,7 @@ export function Navbar() {
                     updates[`notifications/${n.id}/read`] = true;
                 }
             });
-            await update(ref(db), updates);
+            await update(campusRef(), updates);
         }
     };
 
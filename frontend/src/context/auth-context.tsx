@@ -8,9 +8,10 @@ import {
     onAuthStateChanged,
     User
 } from "firebase/auth";
-import { ref, get, set } from "firebase/database";
-import { auth, db } from "@/lib/firebase";
+import { get, set } from "firebase/database";
+import { auth } from "@/lib/firebase";
 import { useRouter } from "next/navigation";
+import { campusRef } from "@/lib/campus";
 
 type UserRole = "ADMIN" | "USER";
 
@@ -39,7 +40,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
                 // The username is stored in the email: username@fbla.local
                 // But better to store additional user details in Realtime DB under /users/{uid}
                 try {
-                    const userRef = ref(db, `users/${currentUser.uid}`);
+                    const userRef = campusRef(`users/${currentUser.uid}`);
                     const snapshot = await get(userRef);
                     if (snapshot.exists()) {
                         setRole(snapshot.val().role);
@@ -78,7 +79,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
         const assignedRole: UserRole = "USER";
 
         // Save user profile to Realtime DB
-        await set(ref(db, `users/${uid}`), {
+        await set(campusRef(`users/${uid}`), {
             username,
             role: assignedRole,
             createdAt: new Date().toISOString()
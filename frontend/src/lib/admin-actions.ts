@@ -0,0 +1,43 @@
+import type { User } from "firebase/auth";
+import { campusHeaders } from "@/lib/campus";
+
+export type AdminOperation = Record<string, unknown>;
+
+// Apply admin operations on the backend as one atomic write; throws if any operation failed
+export async function runAdminActions(user: User | null, operations: AdminOperation[]) {
+    if (!user) throw new Error("Not signed in");
+    const token = await user.getIdToken();
+    const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/admin/actions`, {
+        method: "POST",
+        headers: campusHeaders({ "Content-Type": "application/json", Authorization: `Bearer ${token}` }),
+        body: JSON.stringify({ operations })
+    });
+    if (!res.ok) throw new Error("Admin actions request failed");
+    const data = await res.json();
+    const failed = data.results.find((r: { ok: boolean }) => !r.ok);
+    if (failed) throw new Error(failed.error);
+    return data.results;
+}
+
+// Correct an item's high-value flag; the backend also retrains its local value classifier on it
+export async function saveValueOverride(
+    user: User | null,
+    item: { id: string; title: string; description: string; category: string },
+    highValue: boolean
+) {
+    if (!user) throw new Error("Not signed in");
+    const token = await user.getIdToken();
+    const res = await fetch(`${process.env.NEXT_PUBLIC_BACKEND_URL}/api/admin/value-override`, {
+        method: "POST",
+        headers: campusHeaders({ "Content-Type": "application/json", Authorization: `Bearer ${token}` }),
+        body: JSON.stringify({
+            item_id: item.id,
+            title: item.title,
+            description: item.description,
+            category: item.category,
+            highValue
+        })
+    });
+    if (!res.ok) throw new Error("Value override request failed");
+    return res.json();
+}
@@ -0,0 +1,18 @@
+import { ref } from "firebase/database";
+import { db } from "@/lib/firebase";
+
+// Campus this deployment serves. The root must match the campus's "root" in the
+// backend's CAMPUSES config ("" keeps data at the top of the database).
+export const CAMPUS_ID = process.env.NEXT_PUBLIC_CAMPUS_ID || "";
+export const CAMPUS_ROOT = (process.env.NEXT_PUBLIC_CAMPUS_ROOT || "").replace(/^\/+|\/+$/g, "");
+
+// Database reference inside this campus's data root
+export function campusRef(path?: string) {
+    const full = [CAMPUS_ROOT, path?.replace(/^\/+/, "")].filter(Boolean).join("/");
+    return full ? ref(db, full) : ref(db);
+}
+
+// Request headers for the backend, routed to this campus
+export function campusHeaders(headers: Record<string, string> = {}): Record<string, string> {
+    return CAMPUS_ID ? { ...headers, "X-Campus-Id": CAMPUS_ID } : headers;
+}